@@ -3,12 +3,27 @@ Vertical Academic Search Engine - Flask Application
 
 A Google Scholar-like search engine for Coventry University's
 Research Centre for Computational Science and Mathematical Modelling.
+
+For multi-worker deployments, set FLASK_PRELOAD=1 and let gunicorn load
+the app once in the master so forked workers share the index pages:
+
+    FLASK_PRELOAD=1 gunicorn --preload -w 4 -k gthread app:app
+
+Crawl jobs are tracked in files under DATA_DIR (see scheduler.crawl_jobs),
+so any worker can report a job's status and only one crawl runs across
+all workers.
 """
 import os
-import json
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import wraps
+from functools import wraps, lru_cache
+from types import MappingProxyType
 from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
+from flask.json.provider import JSONProvider
+import orjson
 
 import config
 from indexer.inverted_index import InvertedIndex
@@ -19,22 +34,74 @@ from classifier.trainer import ClassifierTrainer, save_sample_training_data
 from classifier.predictor import DocumentClassifier
 from scheduler.crawl_scheduler import get_scheduler
 from scheduler.crawl_history import CrawlHistory
+from scheduler.crawl_jobs import CrawlJobs
 from scheduler.crawl_summary import get_crawl_summary
 
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Numpy scalars and non-str dict keys (e.g. numpy.str_ category labels
+    from the classifier) are serialized natively; anything else orjson
+    does not know falls back to str().
+    """
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str, option=self.option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand the encoded bytes to the response without a str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=str, option=self.option)
+        return self._app.response_class(body, mimetype='application/json')
+
+
 # Initialize Flask app
 app = Flask(__name__)
 app.secret_key = 'ir-search-engine-secret-key-2024'
+app.json = OrjsonProvider(app)
 
 # Initialize components
 inverted_index = InvertedIndex()
-query_processor = None
-classifier = DocumentClassifier()
 crawl_scheduler = get_scheduler()
 crawl_history = CrawlHistory()
 crawl_summary = get_crawl_summary()
 
-# Crawler log storage
-crawler_log = []
+# Created lazily per worker, see get_classifier() and get_query_processor()
+_classifier = None
+_classifier_lock = threading.Lock()
+_query_processor = None
+_query_processor_lock = threading.Lock()
+# Bumped on every index rebuild; part of the search cache key so results a
+# search stores after the rebuild's cache_clear() are never served
+_index_generation = 0
+
+# Crawler log storage (last 100 lines; also written by the scheduler thread)
+crawler_log = deque(maxlen=100)
+crawler_log_lock = threading.Lock()
+
+# Crawls (admin-triggered and scheduled) run off the request and scheduler
+# threads; crawl_jobs is shared between processes and allows one at a time
+crawl_executor = ThreadPoolExecutor(max_workers=1)
+crawl_jobs = CrawlJobs()
+
+# Templates compiled once at startup instead of on first request
+TEMPLATE_NAMES = (
+    'index.html',
+    'search.html',
+    'classify.html',
+    'admin.html',
+    'admin_login.html',
+    'crawl_history.html',
+    'crawl_summary.html',
+    'base.html',
+)
 
 
 def admin_required(f):
@@ -48,9 +115,57 @@ def admin_required(f):
     return decorated_function
 
 
+def get_classifier():
+    """
+    Get the shared document classifier, loading the model on first use.
+
+    Returns:
+        DocumentClassifier instance (may not be loaded if no model exists)
+    """
+    global _classifier
+    with _classifier_lock:
+        if _classifier is None:
+            _classifier = DocumentClassifier()
+            _classifier.load_model()
+        return _classifier
+
+
+def get_query_processor():
+    """
+    Get the shared query processor, creating it on first use.
+
+    Returns:
+        QueryProcessor bound to the global inverted index
+    """
+    global _query_processor
+    with _query_processor_lock:
+        if _query_processor is None:
+            _query_processor = QueryProcessor(inverted_index)
+        return _query_processor
+
+
+def reset_query_processor():
+    """Rebuild the query processor and drop cached results after the index changes."""
+    global _query_processor, _index_generation
+    with _query_processor_lock:
+        _query_processor = QueryProcessor(inverted_index)
+        _index_generation += 1
+    _cached_search.cache_clear()
+
+
+_app_initialized = False
+
+
 def init_app():
-    """Initialize the application components."""
-    global query_processor
+    """
+    Initialize the application components.
+
+    Safe to call more than once; only the first call does any work.
+    """
+    global _app_initialized
+    if _app_initialized:
+        return
+    _app_initialized = True
 
     # Download NLTK data
     print("Downloading NLTK data...")
@@ -60,21 +175,21 @@ def init_app():
     os.makedirs(config.DATA_DIR, exist_ok=True)
     os.makedirs(config.CLASSIFICATION_DATA_DIR, exist_ok=True)
 
+    # Disable per-request template mtime checks outside debug mode
+    if not config.FLASK_DEBUG:
+        app.config['TEMPLATES_AUTO_RELOAD'] = False
+        app.jinja_env.auto_reload = False
+
+    # Prime the Jinja template cache
+    for template_name in TEMPLATE_NAMES:
+        app.jinja_env.get_template(template_name)
+
     # Try to load existing index
     if inverted_index.load():
         print(f"Loaded index with {len(inverted_index)} documents")
     else:
         print("No existing index found. Load sample data or run crawler.")
 
-    # Initialize query processor
-    query_processor = QueryProcessor(inverted_index)
-
-    # Try to load classifier
-    if classifier.load_model():
-        print("Classifier loaded successfully")
-    else:
-        print("Classifier not found. Train the classifier from Admin page.")
-
     # Initialize crawl history (creates mock data if needed)
     print("Initializing crawl scheduler...")
     _ = crawl_history.load_history()
@@ -89,136 +204,251 @@ def init_app():
     print(f"  Status: Checks every 1 minute")
 
 
+def _normalize_query(query):
+    """Normalize case and whitespace so trivial query variants share a cache entry."""
+    return ' '.join(query.lower().split())
+
+
+@lru_cache(maxsize=512)
+def _cached_search(gen, qnorm, limit=None, page=1, per_page=20, sort_by='relevance'):
+    """
+    Run a search against the current index, memoized until the index changes.
+
+    gen is the _index_generation read before the call. A search still running
+    when the index is rebuilt stores its result under the old generation,
+    which no later lookup uses; reset_query_processor() also clears the cache
+    to free those entries. Results are shared between requests, so they are
+    returned as read-only views: a tuple of hits, or a mapping proxy over
+    the paginated result with its hits as a tuple.
+    """
+    if limit is not None:
+        return tuple(get_query_processor().search(qnorm, limit=limit))
+    result = get_query_processor().search(qnorm, page=page, per_page=per_page, sort_by=sort_by)
+    return MappingProxyType({**result, 'results': tuple(result['results'])})
+
+
+def _search_page(qnorm, page, per_page, sort_by='relevance'):
+    """
+    Get one page of paginated results, clamping page to the valid range.
+
+    page is normalised before the cached call so out-of-range page numbers
+    share the first or last page's cache entry instead of adding new ones.
+    """
+    gen = _index_generation
+    first = _cached_search(gen, qnorm, page=1, per_page=per_page, sort_by=sort_by)
+    page = max(1, min(page, first['total_pages']))
+    if page == 1:
+        return first
+    return _cached_search(gen, qnorm, page=page, per_page=per_page, sort_by=sort_by)
+
+
 def log_message(msg):
     """Add message to crawler log."""
-    crawler_log.append(msg)
+    with crawler_log_lock:
+        crawler_log.append(msg)
+    crawl_jobs.append_log(msg)
     print(msg)
 
 
-def _crawl_callback():
-    """Callback function for scheduled crawls."""
-    global query_processor, crawler_log
+def _run_crawl_job(max_authors, trigger):
+    """
+    Crawl the portal, rebuild the index and record the run.
+
+    Shared by scheduled crawls and the admin-triggered background job.
+
+    Args:
+        max_authors: Maximum number of authors to crawl
+        trigger: What started the crawl ('scheduled' or 'manual')
+
+    Returns:
+        Dictionary with the final 'status' and a human-readable 'message'
+    """
+    # Track crawl timing
+    started_at = datetime.now()
+    crawl_status = "completed"
+    crawl_errors = []
+    crawler = None
+
     try:
-        log_message("=" * 60)
-        log_message("[SCHEDULED CRAWL] Starting scheduled crawl...")
-        log_message("=" * 60)
+        log_message('Crawler started. This may take several minutes...')
 
-        # Track crawl timing
-        started_at = datetime.now()
-        crawl_status = "completed"
-        crawl_errors = []
-        crawler = None
+        crawler = PUREPortalCrawler(callback=log_message)
+        publications = crawler.crawl(max_authors=max_authors)
 
-        try:
-            log_message('Crawler started. This may take several minutes...')
+        completed_at = datetime.now()
 
-            crawler = PUREPortalCrawler(callback=log_message)
-            publications = crawler.crawl(max_authors=50)
+        if publications:
+            # Save crawled data
+            crawler.save_data()
 
-            completed_at = datetime.now()
+            # Build index
+            inverted_index.build_from_publications(publications)
+            inverted_index.save()
 
-            if publications:
-                # Save crawled data
-                crawler.save_data()
+            # Reinitialize query processor
+            reset_query_processor()
 
-                # Build index
-                inverted_index.build_from_publications(publications)
-                inverted_index.save()
+            # Get detailed metrics from crawler
+            crawl_metrics = crawler.get_crawl_metrics()
 
-                # Reinitialize query processor
-                query_processor = QueryProcessor(inverted_index)
-
-                # Get detailed metrics from crawler
-                crawl_metrics = crawler.get_crawl_metrics()
-
-                # Record crawl in history (basic)
-                crawl_stats = {
-                    "authors_crawled": len(crawler.author_profiles),
-                    "publications_found": crawl_metrics.get('total_publications_found', len(publications)),
-                    "unique_publications": crawl_metrics.get('unique_publications', len(publications)),
-                    "duplicates_detected": crawl_metrics.get('duplicates_detected', 0),
-                    "pages_visited": len(crawler.visited_urls)
-                }
-                crawl_history.create_crawl_record(
-                    started_at=started_at,
-                    completed_at=completed_at,
-                    stats=crawl_stats,
-                    status=crawl_status,
-                    errors=crawl_errors,
-                    trigger="scheduled"
-                )
-
-                # Save detailed crawl summary
-                crawl_summary.create_summary(
-                    started_at=started_at,
-                    completed_at=completed_at,
-                    status=crawl_status,
-                    trigger="scheduled",
-                    crawl_metrics=crawl_metrics,
-                    errors=crawl_errors
-                )
-
-                log_message(f'Successfully crawled {len(publications)} unique publications '
-                    f'({crawl_metrics.get("duplicates_detected", 0)} duplicates skipped)!')
-            else:
-                completed_at = datetime.now()
-                # Get metrics even for empty crawl
-                crawl_metrics = crawler.get_crawl_metrics() if crawler else {}
-
-                # Record failed/empty crawl
-                crawl_history.create_crawl_record(
-                    started_at=started_at,
-                    completed_at=completed_at,
-                    stats={"authors_crawled": 0, "publications_found": 0},
-                    status="completed_with_warnings",
-                    errors=["No publications found"],
-                    trigger="scheduled"
-                )
-
-                # Save summary for empty crawl
-                crawl_summary.create_summary(
-                    started_at=started_at,
-                    completed_at=completed_at,
-                    status="completed_with_warnings",
-                    trigger="scheduled",
-                    crawl_metrics=crawl_metrics,
-                    errors=["No publications found"]
-                )
-
-                log_message('Crawler completed but no publications found.')
-
-        except Exception as e:
+            # Record crawl in history (basic)
+            crawl_stats = {
+                "authors_crawled": len(crawler.author_profiles),
+                "publications_found": crawl_metrics.get('total_publications_found', len(publications)),
+                "unique_publications": crawl_metrics.get('unique_publications', len(publications)),
+                "duplicates_detected": crawl_metrics.get('duplicates_detected', 0),
+                "pages_visited": len(crawler.visited_urls)
+            }
+            crawl_history.create_crawl_record(
+                started_at=started_at,
+                completed_at=completed_at,
+                stats=crawl_stats,
+                status=crawl_status,
+                errors=crawl_errors,
+                trigger=trigger
+            )
+
+            # Save detailed crawl summary
+            crawl_summary.create_summary(
+                started_at=started_at,
+                completed_at=completed_at,
+                status=crawl_status,
+                trigger=trigger,
+                crawl_metrics=crawl_metrics,
+                errors=crawl_errors
+            )
+
+            message = (f'Successfully crawled {len(publications)} unique publications '
+                       f'({crawl_metrics.get("duplicates_detected", 0)} duplicates skipped)!')
+        else:
             completed_at = datetime.now()
-            # Get metrics if crawler was initialized
+            crawl_status = "completed_with_warnings"
+            # Get metrics even for empty crawl
             crawl_metrics = crawler.get_crawl_metrics() if crawler else {}
 
-            # Record failed crawl
+            # Record failed/empty crawl
             crawl_history.create_crawl_record(
                 started_at=started_at,
                 completed_at=completed_at,
-                stats={},
-                status="failed",
-                errors=[str(e)],
-                trigger="scheduled"
+                stats={"authors_crawled": 0, "publications_found": 0},
+                status=crawl_status,
+                errors=["No publications found"],
+                trigger=trigger
             )
 
-            # Save summary for failed crawl
+            # Save summary for empty crawl
             crawl_summary.create_summary(
                 started_at=started_at,
                 completed_at=completed_at,
-                status="failed",
-                trigger="scheduled",
+                status=crawl_status,
+                trigger=trigger,
                 crawl_metrics=crawl_metrics,
-                errors=[str(e)]
+                errors=["No publications found"]
             )
 
-            log_message(f'Crawler error: {str(e)}')
-         
+            message = 'Crawler completed but no publications found.'
+
+    except Exception as e:
+        completed_at = datetime.now()
+        crawl_status = "failed"
+        # Get metrics if crawler was initialized
+        crawl_metrics = crawler.get_crawl_metrics() if crawler else {}
+
+        # Record failed crawl
+        crawl_history.create_crawl_record(
+            started_at=started_at,
+            completed_at=completed_at,
+            stats={},
+            status=crawl_status,
+            errors=[str(e)],
+            trigger=trigger
+        )
+
+        # Save summary for failed crawl
+        crawl_summary.create_summary(
+            started_at=started_at,
+            completed_at=completed_at,
+            status=crawl_status,
+            trigger=trigger,
+            crawl_metrics=crawl_metrics,
+            errors=[str(e)]
+        )
+
+        message = f'Crawler error: {str(e)}'
+
+    log_message(message)
+    return {'status': crawl_status, 'message': message}
+
+
+def _start_crawl_job(trigger, fn, *args):
+    """
+    Register and start a crawl job unless one is already running.
+
+    The crawler log is cleared only when no job is active, so a running
+    crawl's log is never wiped.
+
+    Args:
+        trigger: What started the crawl ('scheduled' or 'manual')
+        fn: Job function run on crawl_executor; returns the result dict
+        *args: Arguments for fn
+
+    Returns:
+        Tuple of (job_id, future), or None if a crawl is already running
+    """
+    job_id = crawl_jobs.try_start(trigger)
+    if job_id is None:
+        return None
+
+    with crawler_log_lock:
+        crawler_log.clear()
+
+    future = crawl_executor.submit(_run_registered_job, job_id, fn, *args)
+    return job_id, future
+
+
+def _run_registered_job(job_id, fn, *args):
+    """Run a crawl job and record its result in the shared registry."""
+    result = {'status': 'failed', 'message': 'Crawl failed'}
+    try:
+        result = fn(*args)
+        return result
+    except Exception as e:
+        result = {'status': 'failed', 'message': str(e)}
+        raise
+    finally:
+        crawl_jobs.finish(job_id, result)
+
+
+def _run_scheduled_crawl():
+    """Run a scheduled crawl as a registered crawl job."""
+    try:
+        log_message("=" * 60)
+        log_message("[SCHEDULED CRAWL] Starting scheduled crawl...")
+        log_message("=" * 60)
+
+        return _run_crawl_job(max_authors=50, trigger="scheduled")
+
     except Exception as e:
         log_message(f"[SCHEDULED CRAWL] Failed: {str(e)}")
         raise
 
 
+def _crawl_callback():
+    """
+    Callback function for scheduled crawls.
+
+    Goes through the same job registry as admin-triggered crawls, so the
+    two never overlap, and blocks until the crawl finishes.
+    """
+    job = _start_crawl_job("scheduled", _run_scheduled_crawl)
+    if job is None:
+        log_message("[SCHEDULED CRAWL] Skipped: a crawl is already running")
+        return None
+
+    _, future = job
+    return future.result()
+
+
 @app.context_processor
 def inject_stats():
     """Inject index statistics into all templates."""
@@ -261,7 +491,7 @@ def search():
     }
 
     if query:
-        search_result = query_processor.search(query, page=page, per_page=per_page, sort_by=sort_by)
+        search_result = _search_page(_normalize_query(query), page, per_page, sort_by)
         
         # Extract pagination info
         pagination = {
@@ -271,21 +501,11 @@ def search():
             'total_pages': search_result['total_pages']
         }
 
-        # Convert to template-friendly format
-        for doc_id, doc, score in search_result['results']:
-            results.append({
-                'doc_id': doc_id,
-                'title': doc.get('title', 'Untitled'),
-                'authors': doc.get('authors', []),
-                'year': doc.get('year', 'N/A'),
-                'abstract': doc.get('abstract', ''),
-                'keywords': doc.get('keywords', []),
-                'publication_link': doc.get('publication_link', ''),
-                'author_profiles': doc.get('author_profiles', {}),
-                'score': score
-            })
+        # (doc_id, doc, score) tuples go straight to the template
+        results = search_result['results']
 
-    return render_template('search.html', query=query, results=results, pagination=pagination, sort_by=sort_by)
+    return render_template('search.html', query=query, results=results,
+                           pagination=pagination, sort_by=sort_by)
 
 
 @app.route('/classify', methods=['GET', 'POST'])
@@ -297,12 +517,12 @@ def classify():
     if request.method == 'POST':
         text = request.form.get('text', '').strip()
         if text:
-            result = classifier.classify(text)
+            result = get_classifier().classify(text)
 
     # Only show model info to admin
     model_info = None
     if session.get('admin_logged_in'):
-        model_info = classifier.get_model_info()
+        model_info = get_classifier().get_model_info()
 
     return render_template('classify.html',
                          result=result,
@@ -347,8 +567,9 @@ def admin_logout():
 @admin_required
 def admin():
     """Admin page for system management."""
-    classifier_info = classifier.get_model_info()
-    log_text = '\n'.join(crawler_log[-100:]) if crawler_log else None
+    classifier_info = get_classifier().get_model_info()
+    with crawler_log_lock:
+        log_text = '\n'.join(crawler_log) if crawler_log else None
     schedule_info = crawl_scheduler.get_schedule_info()
 
     return render_template('admin.html',
@@ -375,26 +596,28 @@ def admin_crawl_history():
 @admin_required
 def load_sample_data():
     """Load sample publication data."""
-    global query_processor
-
     try:
         # Get sample publications
         publications = get_sample_publications()
 
         # Save to JSON file
         os.makedirs(config.DATA_DIR, exist_ok=True)
-        with open(config.PUBLICATIONS_FILE, 'w', encoding='utf-8') as f:
-            json.dump({
+        # Write to a temp file and swap it in so a crash never leaves a
+        # truncated publications file behind
+        tmp_path = config.PUBLICATIONS_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps({
                 'publications': publications,
                 'total_publications': len(publications)
-            }, f, indent=2)
+            }, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, config.PUBLICATIONS_FILE)
 
         # Build index
         inverted_index.build_from_publications(publications)
         inverted_index.save()
 
         # Reinitialize query processor
-        query_processor = QueryProcessor(inverted_index)
+        reset_query_processor()
 
         flash(f'Successfully loaded {len(publications)} sample publications!', 'success')
 
@@ -407,123 +630,16 @@ def load_sample_data():
 @app.route('/admin/run-crawler', methods=['POST'])
 @admin_required
 def run_crawler():
-    """Run the web crawler."""
-    global query_processor, crawler_log
-
+    """Start the web crawler as a background job."""
     max_authors = int(request.form.get('max_authors', 20))
-    crawler_log = []
-
-    # Track crawl timing
-    started_at = datetime.now()
-    crawl_status = "completed"
-    crawl_errors = []
-    crawler = None
-
-    try:
-        flash('Crawler started. This may take several minutes...', 'info')
-
-        crawler = PUREPortalCrawler(callback=log_message)
-        publications = crawler.crawl(max_authors=max_authors)
-
-        completed_at = datetime.now()
-
-        if publications:
-            # Save crawled data
-            crawler.save_data()
-
-            # Build index
-            inverted_index.build_from_publications(publications)
-            inverted_index.save()
-
-            # Reinitialize query processor
-            query_processor = QueryProcessor(inverted_index)
-
-            # Get detailed metrics from crawler
-            crawl_metrics = crawler.get_crawl_metrics()
-
-            # Record crawl in history (basic)
-            crawl_stats = {
-                "authors_crawled": len(crawler.author_profiles),
-                "publications_found": crawl_metrics.get('total_publications_found', len(publications)),
-                "unique_publications": crawl_metrics.get('unique_publications', len(publications)),
-                "duplicates_detected": crawl_metrics.get('duplicates_detected', 0),
-                "pages_visited": len(crawler.visited_urls)
-            }
-            crawl_history.create_crawl_record(
-                started_at=started_at,
-                completed_at=completed_at,
-                stats=crawl_stats,
-                status=crawl_status,
-                errors=crawl_errors,
-                trigger="manual"
-            )
-
-            # Save detailed crawl summary
-            crawl_summary.create_summary(
-                started_at=started_at,
-                completed_at=completed_at,
-                status=crawl_status,
-                trigger="manual",
-                crawl_metrics=crawl_metrics,
-                errors=crawl_errors
-            )
-
-            flash(f'Successfully crawled {len(publications)} unique publications '
-                  f'({crawl_metrics.get("duplicates_detected", 0)} duplicates skipped)!', 'success')
-        else:
-            completed_at = datetime.now()
-            # Get metrics even for empty crawl
-            crawl_metrics = crawler.get_crawl_metrics() if crawler else {}
-
-            # Record failed/empty crawl
-            crawl_history.create_crawl_record(
-                started_at=started_at,
-                completed_at=completed_at,
-                stats={"authors_crawled": 0, "publications_found": 0},
-                status="completed_with_warnings",
-                errors=["No publications found"],
-                trigger="manual"
-            )
-
-            # Save summary for empty crawl
-            crawl_summary.create_summary(
-                started_at=started_at,
-                completed_at=completed_at,
-                status="completed_with_warnings",
-                trigger="manual",
-                crawl_metrics=crawl_metrics,
-                errors=["No publications found"]
-            )
-
-            flash('Crawler completed but no publications found.', 'warning')
-
-    except Exception as e:
-        completed_at = datetime.now()
-        # Get metrics if crawler was initialized
-        crawl_metrics = crawler.get_crawl_metrics() if crawler else {}
-
-        # Record failed crawl
-        crawl_history.create_crawl_record(
-            started_at=started_at,
-            completed_at=completed_at,
-            stats={},
-            status="failed",
-            errors=[str(e)],
-            trigger="manual"
-        )
 
-        # Save summary for failed crawl
-        crawl_summary.create_summary(
-            started_at=started_at,
-            completed_at=completed_at,
-            status="failed",
-            trigger="manual",
-            crawl_metrics=crawl_metrics,
-            errors=[str(e)]
-        )
-
-        flash(f'Crawler error: {str(e)}', 'danger')
+    job = _start_crawl_job("manual", _run_crawl_job, max_authors, "manual")
+    if job is None:
+        flash('A crawl is already running.', 'warning')
+        return redirect(url_for('admin'))
 
+    job_id, _ = job
+    flash(f'Crawler started (job {job_id}). This may take several minutes...', 'info')
     return redirect(url_for('admin'))
 
 
@@ -531,13 +647,11 @@ def run_crawler():
 @admin_required
 def rebuild_index():
     """Rebuild the search index from saved data."""
-    global query_processor
-
     try:
         # Load publications from JSON
         if os.path.exists(config.PUBLICATIONS_FILE):
-            with open(config.PUBLICATIONS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(config.PUBLICATIONS_FILE, 'rb') as f:
+                data = orjson.loads(f.read())
 
             publications = data.get('publications', [])
 
@@ -547,7 +661,7 @@ def rebuild_index():
                 inverted_index.save()
 
                 # Reinitialize query processor
-                query_processor = QueryProcessor(inverted_index)
+                reset_query_processor()
 
                 flash(f'Index rebuilt with {len(publications)} publications!', 'success')
             else:
@@ -572,7 +686,7 @@ def train_classifier():
             save_sample_training_data()
 
         # Load training data
-        trainer = ClassifierTrainer()
+        trainer = ClassifierTrainer(n_jobs=config.WEB_CLASSIFIER_N_JOBS)
         texts, labels = trainer.load_training_data()
 
         if len(texts) < 10:
@@ -584,7 +698,7 @@ def train_classifier():
         trainer.save_model()
 
         # Reload classifier
-        classifier.load_model()
+        get_classifier().load_model()
 
         accuracy = stats.get('accuracy', 0) * 100
         flash(f'Classifier trained successfully! Accuracy: {accuracy:.1f}%', 'success')
@@ -597,6 +711,21 @@ def train_classifier():
 
 # ============ API Endpoints ============
 
+def _conditional_response(response):
+    """
+    Tag a JSON response with a weak ETag and honour If-None-Match.
+
+    Args:
+        response: Response whose body is already serialized
+
+    Returns:
+        The response, or a bodiless 304 if the client's copy is current
+    """
+    etag = hashlib.blake2b(response.get_data(), digest_size=8).hexdigest()
+    response.set_etag(etag, weak=True)
+    return response.make_conditional(request)
+
+
 @app.route('/api/search')
 def api_search():
     """API endpoint for search with pagination."""
@@ -612,7 +741,7 @@ def api_search():
 
     # Use limit if provided (backward compatibility), otherwise use pagination
     if limit is not None:
-        raw_results = query_processor.search(query, limit=limit)
+        raw_results = _cached_search(_index_generation, _normalize_query(query), limit=limit)
         results = []
         for doc_id, doc, score in raw_results:
             results.append({
@@ -623,17 +752,17 @@ def api_search():
                 'abstract': doc.get('abstract', ''),
                 'publication_link': doc.get('publication_link', ''),
                 'author_profiles': doc.get('author_profiles', {}),
-                'score': round(score, 4)
+                'score': score
             })
-        return jsonify({
+        return _conditional_response(jsonify({
             'query': query,
             'count': len(results),
             'results': results
-        })
+        }))
     
     # Paginated search
     per_page = max(5, min(per_page, 100))
-    search_result = query_processor.search(query, page=page, per_page=per_page)
+    search_result = _search_page(_normalize_query(query), page, per_page)
 
     results = []
     for doc_id, doc, score in search_result['results']:
@@ -645,10 +774,10 @@ def api_search():
             'abstract': doc.get('abstract', ''),
             'publication_link': doc.get('publication_link', ''),
             'author_profiles': doc.get('author_profiles', {}),
-            'score': round(score, 4)
+            'score': score
         })
 
-    return jsonify({
+    return _conditional_response(jsonify({
         'query': query,
         'results': results,
         'pagination': {
@@ -657,7 +786,7 @@ def api_search():
             'per_page': search_result['per_page'],
             'total_pages': search_result['total_pages']
         }
-    })
+    }))
 
 
 @app.route('/api/classify', methods=['POST'])
@@ -672,7 +801,7 @@ def api_classify():
     if not text:
         return jsonify({'error': 'Empty text'})
 
-    result = classifier.classify(text)
+    result = get_classifier().classify(text)
     return jsonify(result)
 
 
@@ -680,11 +809,33 @@ def api_classify():
 @admin_required
 def api_stats():
     """API endpoint for system statistics (admin only)."""
-    return jsonify({
+    return _conditional_response(jsonify({
         'index': inverted_index.get_statistics(),
-        'classifier': classifier.get_model_info(),
+        'classifier': get_classifier().get_model_info(),
         'schedule': crawl_scheduler.get_schedule_info()
-    })
+    }))
+
+
+@app.route('/api/crawl-status/<job_id>')
+@admin_required
+def api_crawl_status(job_id):
+    """API endpoint for the status of a background crawl job (admin only)."""
+    job = crawl_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Crawl job not found'}), 404
+
+    started_at = datetime.fromisoformat(job['started_at'])
+    status = {
+        'job_id': job_id,
+        'done': job['done'],
+        'started_at': job['started_at'],
+        'elapsed_seconds': (datetime.now() - started_at).total_seconds(),
+        'log': job['log']
+    }
+    if job['done']:
+        status['result'] = job['result']
+
+    return jsonify(status)
 
 
 @app.route('/api/crawl-summary')
@@ -741,6 +892,14 @@ def server_error(e):
 
 # ============ Main ============
 
+# Under gunicorn --preload this runs once in the master before workers fork.
+# The background scheduler thread is not inherited by the workers, so
+# scheduled crawls only refresh the master's copy of the index; workers pick
+# up new data on restart.
+if os.environ.get('FLASK_PRELOAD'):
+    init_app()
+
+
 if __name__ == '__main__':
     print("=" * 60)
     print("Coventry University Research Search Engine")
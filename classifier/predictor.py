@@ -4,12 +4,27 @@ Document Classification Predictor
 Loads trained model and classifies new documents.
 """
 import os
-import pickle
+
+import joblib
+import numpy as np
+from sklearn.naive_bayes import MultinomialNB
 
 import config
 from indexer.preprocessor import TextPreprocessor
 
 
+def _load_artifact(path):
+    """
+    Load a model artifact saved with joblib.
+
+    Numpy arrays are memory-mapped read-only so forked workers share the
+    pages. Files written by older versions with plain pickle load through
+    joblib as well. The trainer replaces artifacts atomically rather than
+    rewriting them, so existing maps stay valid across a retrain.
+    """
+    return joblib.load(path, mmap_mode='r')
+
+
 class DocumentClassifier:
     """
     Classifier for predicting document categories.
@@ -22,6 +37,10 @@ class DocumentClassifier:
         self.categories = config.CLASSIFICATION_CATEGORIES
         self.is_loaded = False
         self.model_stats = {}
+        self.token_input = False
+        self._flp_T = None  # float32 feature_log_prob_.T for direct scoring
+        self._clp = None  # float32 class_log_prior_
+        self._classes = None
         self.preprocessor = TextPreprocessor(
             use_stemming=False,
             use_lemmatization=True
@@ -45,15 +64,17 @@ class DocumentClassifier:
 
         try:
             # Load classifier
-            with open(model_path, 'rb') as f:
-                model_data = pickle.load(f)
-                self.classifier = model_data['classifier']
-                self.categories = model_data.get('categories', self.categories)
-                self.model_stats = model_data.get('stats', {})
+            model_data = _load_artifact(model_path)
+            self.classifier = model_data['classifier']
+            self.categories = model_data.get('categories', self.categories)
+            self.model_stats = model_data.get('stats', {})
+            # Version 2+ vectorizers analyze token lists directly
+            self.token_input = model_data.get('model_version', 1) >= 2
 
             # Load vectorizer
-            with open(vectorizer_path, 'rb') as f:
-                self.vectorizer = pickle.load(f)
+            self.vectorizer = _load_artifact(vectorizer_path)
+
+            self._prepare_fast_path(model_data)
 
             self.is_loaded = True
             return True
@@ -65,6 +86,52 @@ class DocumentClassifier:
             print(f"Error loading model: {e}")
             return False
 
+    def _prepare_fast_path(self, model_data):
+        """
+        Set up the float32 Naive Bayes weights for direct scoring.
+
+        For MultinomialNB the joint log likelihood is simply
+        X @ feature_log_prob_.T + class_log_prior_, so one sparse-dense
+        product replaces separate predict and predict_proba passes.
+        Current models store the transposed float32 weights, which are
+        used straight from the memory-mapped file; older models get a
+        private converted copy.
+
+        Args:
+            model_data: Loaded model artifact dictionary
+        """
+        self._classes = self.classifier.classes_
+        if 'feature_log_prob_T' in model_data:
+            self._flp_T = model_data['feature_log_prob_T']
+            self._clp = model_data['class_log_prior']
+        elif isinstance(self.classifier, MultinomialNB):
+            self._flp_T = np.ascontiguousarray(self.classifier.feature_log_prob_.T, dtype=np.float32)
+            self._clp = np.asarray(self.classifier.class_log_prior_, dtype=np.float32)
+        else:
+            self._flp_T = None
+            self._clp = None
+
+    def _predict_proba(self, X):
+        """
+        Compute class probabilities for a vectorized batch.
+
+        Args:
+            X: Sparse document-term matrix
+
+        Returns:
+            Array of shape (n_documents, n_classes)
+        """
+        if self._flp_T is None:
+            return self.classifier.predict_proba(X)
+
+        jll = X.astype(np.float32, copy=False) @ self._flp_T + self._clp
+
+        # Softmax over classes
+        jll -= jll.max(axis=1, keepdims=True)
+        probabilities = np.exp(jll)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return probabilities
+
     def preprocess_text(self, text):
         """
         Preprocess text for classification.
@@ -73,11 +140,23 @@ class DocumentClassifier:
             text: Raw text
 
         Returns:
-            Preprocessed text string
+            Token list for current models, or a joined string for
+            models saved before token input was supported
         """
         tokens = self.preprocessor.preprocess(text)
+        if self.token_input:
+            return tokens
         return ' '.join(tokens)
 
+    def _error_result(self, error):
+        """Build the result returned when a text cannot be classified."""
+        return {
+            'error': error,
+            'category': None,
+            'confidence': 0,
+            'probabilities': {}
+        }
+
     def classify(self, text):
         """
         Classify a document.
@@ -88,60 +167,62 @@ class DocumentClassifier:
         Returns:
             Dictionary with predicted category and probabilities
         """
-        if not self.is_loaded:
-            if not self.load_model():
-                return {
-                    'error': 'Model not loaded',
-                    'category': None,
-                    'confidence': 0,
-                    'probabilities': {}
-                }
-
-        if not text or not text.strip():
-            return {
-                'error': 'Empty text',
-                'category': None,
-                'confidence': 0,
-                'probabilities': {}
-            }
-
-        # Preprocess
-        processed = self.preprocess_text(text)
-
-        # Vectorize
-        X = self.vectorizer.transform([processed])
-
-        # Predict
-        prediction = self.classifier.predict(X)[0]
-        probabilities = self.classifier.predict_proba(X)[0]
-
-        # Create probability dictionary
-        prob_dict = {}
-        for i, category in enumerate(self.classifier.classes_):
-            prob_dict[category] = round(float(probabilities[i]), 4)
-
-        # Get confidence (probability of predicted class)
-        predicted_idx = list(self.classifier.classes_).index(prediction)
-        confidence = probabilities[predicted_idx]
-
-        return {
-            'category': prediction,
-            'confidence': round(float(confidence), 4),
-            'probabilities': prob_dict,
-            'text_preview': text[:200] + '...' if len(text) > 200 else text
-        }
+        return self.classify_batch([text])[0]
 
     def classify_batch(self, texts):
         """
         Classify multiple documents.
 
+        All non-empty texts are vectorized into a single sparse matrix and
+        scored with one predict_proba call.
+
         Args:
             texts: List of document texts
 
         Returns:
             List of classification results
         """
-        return [self.classify(text) for text in texts]
+        if not self.is_loaded:
+            if not self.load_model():
+                return [self._error_result('Model not loaded') for _ in texts]
+
+        results = [None] * len(texts)
+        valid_indices = []
+        processed = []
+
+        # Preprocess
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = self._error_result('Empty text')
+            else:
+                valid_indices.append(i)
+                processed.append(self.preprocess_text(text))
+
+        if not processed:
+            return results
+
+        # Vectorize
+        X = self.vectorizer.transform(processed)
+
+        # Predict (argmax of the probabilities is the predicted class)
+        probabilities = self._predict_proba(X)
+        classes = self._classes
+        predicted_idx = probabilities.argmax(axis=1)
+        confidences = probabilities[np.arange(len(processed)), predicted_idx]
+
+        for row, i in enumerate(valid_indices):
+            text = texts[i]
+            results[i] = {
+                'category': classes[predicted_idx[row]],
+                'confidence': round(float(confidences[row]), 4),
+                'probabilities': {
+                    category: round(float(prob), 4)
+                    for category, prob in zip(classes, probabilities[row])
+                },
+                'text_preview': text[:200] + '...' if len(text) > 200 else text
+            }
+
+        return results
 
     def get_model_info(self):
         """
@@ -4,44 +4,236 @@ Document Classification Trainer
 Trains a Naive Bayes classifier for categorizing documents
 into Business, Entertainment, and Health categories.
 """
+import hashlib
 import os
-import json
-import pickle
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 
+import ijson
+import joblib
+import orjson
+from joblib import Parallel, delayed
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+import scipy.sparse as sp
+from sklearn.base import clone
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, ENGLISH_STOP_WORDS
+from sklearn.feature_selection import SelectKBest, chi2
 from sklearn.naive_bayes import MultinomialNB
-from sklearn.model_selection import train_test_split, cross_val_score
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import normalize
+from sklearn.utils.validation import check_array, check_is_fitted
+from sklearn.model_selection import StratifiedShuffleSplit, cross_val_score
 from sklearn.metrics import classification_report, confusion_matrix, accuracy_score
 
 import config
 from indexer.preprocessor import TextPreprocessor
 
+# Saved with the model; version 2 vectorizers take token lists, not strings
+MODEL_VERSION = 2
 
-class ClassifierTrainer:
+# Part of the token cache key; bump when the preprocessing pipeline changes
+# in a way _preprocess_key() does not capture (tokenization rules, ...) so
+# cached tokens from older runs are not reused
+PREPROCESS_VERSION = 1
+
+# Training files larger than this are streamed record by record with ijson
+# instead of being parsed whole with orjson
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
+def _token_analyzer(tokens):
     """
-    Trainer for the document classification model.
-    Uses Naive Bayes with TF-IDF features.
+    Vectorizer analyzer for documents that are already tokenized.
+
+    Produces the same features as the default word analyzer with
+    stop_words='english' and ngram_range=(1, 2), without joining the
+    tokens into a string and splitting them again. Kept at module level
+    so the saved vectorizer stays picklable.
+
+    Args:
+        tokens: List of preprocessed tokens
+
+    Returns:
+        List of unigram and bigram features
     """
+    unigrams = [t for t in tokens if t not in ENGLISH_STOP_WORDS]
+    return unigrams + [f"{a} {b}" for a, b in zip(unigrams, unigrams[1:])]
 
-    def __init__(self):
-        """Initialize the trainer."""
-        self.vectorizer = TfidfVectorizer(
-            max_features=5000,
-            min_df=2,
-            max_df=0.95,
-            ngram_range=(1, 2),
-            stop_words='english'
-        )
-        self.classifier = MultinomialNB(alpha=0.1)
-        self.preprocessor = TextPreprocessor(
+
+class _InPlaceTfidfTransformer(TfidfTransformer):
+    """
+    TfidfTransformer that scales the CSR data by the IDF weights directly.
+
+    Older scikit-learn releases multiply by a sparse IDF diagonal in
+    transform(), allocating a second matrix; this indexes a plain IDF
+    array by column instead. Kept at module level so the saved vectorizer
+    stays picklable.
+    """
+
+    def fit(self, X, y=None):
+        """Learn the IDF vector and keep it as a dense 1-D array."""
+        super().fit(X, y)
+        self._idf = np.asarray(self.idf_) if self.use_idf else None
+        return self
+
+    def transform(self, X, copy=True):
+        """Transform a count matrix to a tf or tf-idf representation."""
+        check_is_fitted(self)
+        X = check_array(X, accept_sparse='csr', dtype=[np.float64, np.float32], copy=copy)
+        if not sp.issparse(X):
+            X = sp.csr_matrix(X)
+
+        if self.sublinear_tf:
+            np.log(X.data, X.data)
+            X.data += 1
+
+        if self._idf is not None:
+            X.data *= self._idf.take(X.indices)
+
+        if self.norm is not None:
+            X = normalize(X, norm=self.norm, copy=False)
+
+        return X
+
+
+# Per-process preprocessor, so joblib workers build their NLTK tools once
+_preprocessor = None
+
+
+def _get_preprocessor():
+    """
+    Get this process's shared classification preprocessor.
+
+    Returns:
+        TextPreprocessor configured for classification
+    """
+    global _preprocessor
+    if _preprocessor is None:
+        _preprocessor = TextPreprocessor(
             use_stemming=False,
             use_lemmatization=True
         )
+    return _preprocessor
+
+
+@lru_cache(maxsize=8192)
+def _preprocess(text):
+    """
+    Preprocess one document with the shared preprocessor.
+
+    Module-level so joblib can dispatch it to worker processes, and
+    memoized because the short-form samples repeat verbatim.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Tuple of preprocessed tokens (immutable, as it is shared via the cache)
+    """
+    return tuple(_get_preprocessor().preprocess(text))
+
+
+def _preprocess_key():
+    """
+    Describe the preprocessing pipeline for the on-disk token cache.
+
+    Returns:
+        Tuple of PREPROCESS_VERSION, the preprocessor settings and a digest
+        of its stopword list (NLTK's or the built-in fallback)
+    """
+    preprocessor = _get_preprocessor()
+    stop_words_digest = hashlib.blake2b(
+        '\n'.join(sorted(preprocessor.stop_words)).encode('utf-8'), digest_size=8
+    ).hexdigest()
+    return (PREPROCESS_VERSION, preprocessor.use_stemming,
+            preprocessor.use_lemmatization, preprocessor.expand_synonyms,
+            stop_words_digest)
+
+
+def _preprocess_corpus(texts, preprocess_key, n_jobs=-1):
+    """
+    Preprocess documents in parallel.
+
+    Lemmatization dominates train(), and the training corpus rarely
+    changes, so train() memoizes this on disk with joblib.Memory. The
+    cache is keyed on the texts and preprocess_key, so changing the
+    preprocessor settings or PREPROCESS_VERSION invalidates it.
+
+    Args:
+        texts: List of raw texts
+        preprocess_key: Result of _preprocess_key(); only used as part of
+            the cache key
+        n_jobs: Number of joblib workers (-1 = all cores)
+
+    Returns:
+        List of token tuples, one per text
+    """
+    return Parallel(n_jobs=n_jobs, batch_size=32)(
+        delayed(_preprocess)(t) for t in texts
+    )
+
+
+def _dump_atomic(obj, path, compress=0):
+    """
+    Save an object with joblib, replacing the file atomically.
+
+    Loaded predictors memory-map the saved arrays, so the live file must
+    never be rewritten in place (truncating a mapped file kills readers
+    with SIGBUS). The new file is written next to it and renamed over it;
+    existing maps keep the old inode. The temp file is created with a
+    plain open(), so it gets the usual umask permissions and the model
+    stays readable by other users (e.g. a separate web worker).
+
+    Args:
+        obj: Object to save
+        path: Destination path
+        compress: joblib compression level or (method, level) tuple
+    """
+    tmp_path = path + '.tmp'
+    try:
+        joblib.dump(obj, tmp_path, compress=compress)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class ClassifierTrainer:
+    """
+    Trainer for the document classification model.
+    Uses Naive Bayes with hashed TF-IDF features.
+    """
+
+    def __init__(self, n_jobs=None):
+        """
+        Initialize the trainer.
+
+        Args:
+            n_jobs: Worker processes used by train() (default from config)
+        """
+        # Stateless hashing of raw term counts, then IDF weighting; only
+        # the IDF step needs fitting and there is no vocabulary to build
+        self.vectorizer = Pipeline([
+            ('hash', HashingVectorizer(
+                analyzer=_token_analyzer,
+                n_features=2 ** 18,
+                alternate_sign=False,
+                norm=None,
+                dtype=np.float32
+            )),
+            ('tfidf', _InPlaceTfidfTransformer()),
+            # Keep the terms that best separate the categories
+            ('kbest', SelectKBest(chi2, k=20000))
+        ])
+        self.classifier = MultinomialNB(alpha=0.1)
+        self.preprocessor = _get_preprocessor()
         self.categories = config.CLASSIFICATION_CATEGORIES
         self.is_trained = False
         self.training_stats = {}
+        self.n_jobs = config.CLASSIFIER_N_JOBS if n_jobs is None else n_jobs
 
     def preprocess_text(self, text):
         """
@@ -51,10 +243,48 @@ class ClassifierTrainer:
             text: Raw text
 
         Returns:
-            Preprocessed text string
+            List of preprocessed tokens
+        """
+        return list(_preprocess(text))
+
+    def iter_training_data(self, filepath=None):
+        """
+        Stream labeled samples from the training data JSON file.
+
+        Records are parsed one at a time with ijson, so the file is never
+        held in memory as a list.
+
+        Args:
+            filepath: Path to training data file
+
+        Yields:
+            (text, label) tuples for samples in a known category
+        """
+        if filepath is None:
+            filepath = os.path.join(
+                config.CLASSIFICATION_DATA_DIR,
+                'labeled_articles.json'
+            )
+
+        with open(filepath, 'rb') as f:
+            yield from self._labeled_samples(ijson.items(f, 'item'))
+
+    def _labeled_samples(self, items):
+        """
+        Pick out (text, label) pairs for known categories.
+
+        Args:
+            items: Iterable of training data records
+
+        Yields:
+            (text, label) tuples
         """
-        tokens = self.preprocessor.preprocess(text)
-        return ' '.join(tokens)
+        for item in items:
+            text = item.get('text', '')
+            category = item.get('category', '')
+
+            if text and category in self.categories:
+                yield text, category
 
     def load_training_data(self, filepath=None):
         """
@@ -80,36 +310,91 @@ class ClassifierTrainer:
             )
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if os.path.getsize(filepath) > STREAM_THRESHOLD_BYTES:
+                # Filter records as they stream off disk
+                samples = self.iter_training_data(filepath)
+            else:
+                with open(filepath, 'rb') as f:
+                    samples = self._labeled_samples(orjson.loads(f.read()))
 
             texts = []
             labels = []
 
-            for item in data:
-                text = item.get('text', '')
-                category = item.get('category', '')
-
-                if text and category in self.categories:
-                    texts.append(text)
-                    labels.append(category)
+            for text, category in samples:
+                texts.append(text)
+                labels.append(category)
 
             return texts, labels
 
         except FileNotFoundError:
             print(f"Training data not found: {filepath}")
             return [], []
-        except json.JSONDecodeError as e:
+        except (orjson.JSONDecodeError, ijson.JSONError) as e:
             print(f"Error parsing training data: {e}")
             return [], []
 
+    def train_incremental(self, samples, batch_size=1000):
+        """
+        Train out-of-core on a stream of samples.
+
+        Hashes each minibatch and updates the classifier with
+        MultinomialNB.partial_fit, so memory stays proportional to one
+        batch rather than the corpus. Features are raw hashed term counts
+        (IDF weighting needs a full pass over the data) and no holdout
+        evaluation is done; use train() when the corpus fits in memory.
+
+        Args:
+            samples: Iterable of (text, label) tuples, e.g.
+                self.iter_training_data() for the JSON training file or
+                training_data.iter_csv_training_pairs() for the CSV corpus
+            batch_size: Number of samples per partial_fit call
+
+        Returns:
+            Dictionary of training statistics
+        """
+        hasher = self.vectorizer.named_steps['hash'] if isinstance(self.vectorizer, Pipeline) else self.vectorizer
+        classifier = clone(self.classifier)
+        classes = np.arange(len(self.categories), dtype=np.int8)
+
+        samples = iter(samples)
+        total = 0
+        while True:
+            batch = list(islice(samples, batch_size))
+            if not batch:
+                break
+
+            texts, labels = zip(*batch)
+            X_batch = hasher.transform([_preprocess(t) for t in texts])
+            classifier.partial_fit(X_batch, self._encode_labels(labels), classes=classes)
+            total += len(batch)
+
+        if total == 0:
+            raise ValueError("No training samples")
+
+        # The saved vectorizer must match what the classifier was fit on
+        self.vectorizer = hasher
+        self.classifier = classifier
+        self._cast_parameters_float32()
+        self._restore_class_names()
+        self.is_trained = True
+        self.training_stats = {
+            'train_size': total,
+            'test_size': 0,
+            'total_samples': total,
+            'incremental': True,
+            'trained_at': datetime.now().isoformat()
+        }
+
+        return self.training_stats
+
     def train(self, texts, labels, test_size=0.2):
         """
         Train the classifier.
 
         Args:
             texts: List of document texts
-            labels: List of category labels
+            labels: List of category labels, or an integer array of indices
+                into the configured categories
             test_size: Fraction of data for testing
 
         Returns:
@@ -118,40 +403,66 @@ class ClassifierTrainer:
         if len(texts) < 10:
             raise ValueError("Insufficient training data (minimum 10 samples)")
 
-        # Preprocess texts
-        processed_texts = [self.preprocess_text(t) for t in texts]
-
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            processed_texts, labels,
-            test_size=test_size,
-            random_state=42,
-            stratify=labels
+        # Preprocess and hash each distinct text once; short-form samples
+        # repeat verbatim, so rows are expanded back afterwards
+        unique_texts = list(dict.fromkeys(texts))
+        row_of = {text: i for i, text in enumerate(unique_texts)}
+        inverse = np.fromiter((row_of[t] for t in texts), dtype=np.intp, count=len(texts))
+
+        # Tokens are reused across runs from the on-disk cache, which keeps
+        # only the most recent corpus versions
+        memory = joblib.Memory(
+            os.path.join(config.CLASSIFICATION_DATA_DIR, 'token_cache'),
+            verbose=0
         )
+        processed_texts = memory.cache(_preprocess_corpus, ignore=['n_jobs'])(
+            unique_texts, _preprocess_key(), n_jobs=self.n_jobs
+        )
+        memory.reduce_size(items_limit=config.TOKEN_CACHE_MAX_ITEMS)
+
+        # Vectorize the whole corpus once; the split and cross-validation
+        # below reuse rows of this matrix instead of re-vectorizing. IDF is
+        # fit on the expanded counts so duplicates still count towards it
+        counts = self.vectorizer.named_steps['hash'].transform(processed_texts)[inverse]
+        X_all_vec = self.vectorizer.named_steps['tfidf'].fit_transform(counts)
 
-        # Vectorize
-        X_train_vec = self.vectorizer.fit_transform(X_train)
-        X_test_vec = self.vectorizer.transform(X_test)
+        # Split data
+        splitter = StratifiedShuffleSplit(n_splits=1, test_size=test_size, random_state=42)
+        y_all = self._encode_labels(labels)
+        train_idx, test_idx = next(splitter.split(X_all_vec, y_all))
+        # Sorted indices let the CSR row slices copy rows in storage order
+        train_idx.sort()
+        test_idx.sort()
+        y_train, y_test = y_all[train_idx], y_all[test_idx]
+
+        # Select features on the training rows only so test labels don't leak
+        selector = self.vectorizer.named_steps['kbest']
+        X_train_vec = selector.fit_transform(X_all_vec[train_idx], y_train)
+        X_test_vec = selector.transform(X_all_vec[test_idx])
 
         # Train classifier
         self.classifier.fit(X_train_vec, y_train)
+        self._cast_parameters_float32()
 
         # Evaluate
         y_pred = self.classifier.predict(X_test_vec)
 
-        # Calculate metrics
+        # Calculate metrics (on class indices, reported by category name)
+        class_indices = np.arange(len(self.categories))
         accuracy = accuracy_score(y_test, y_pred)
-        conf_matrix = confusion_matrix(y_test, y_pred, labels=self.categories)
+        conf_matrix = confusion_matrix(y_test, y_pred, labels=class_indices)
         class_report = classification_report(
             y_test, y_pred,
+            labels=class_indices,
             target_names=self.categories,
             output_dict=True
         )
 
-        # Cross-validation
-        X_all_vec = self.vectorizer.transform(processed_texts)
-        cv_scores = cross_val_score(self.classifier, X_all_vec, labels, cv=5)
+        # Cross-validation (features are reselected inside each fold)
+        cv_model = Pipeline([('kbest', clone(selector)), ('nb', clone(self.classifier))])
+        cv_scores = cross_val_score(cv_model, X_all_vec, y_all, cv=5, n_jobs=self.n_jobs)
 
+        self._restore_class_names()
         self.is_trained = True
         self.training_stats = {
             'accuracy': accuracy,
@@ -159,21 +470,68 @@ class ClassifierTrainer:
             'cv_std': cv_scores.std(),
             'confusion_matrix': conf_matrix.tolist(),
             'classification_report': class_report,
-            'train_size': len(X_train),
-            'test_size': len(X_test),
+            'train_size': len(train_idx),
+            'test_size': len(test_idx),
             'total_samples': len(texts),
             'trained_at': datetime.now().isoformat()
         }
 
         return self.training_stats
 
-    def save_model(self, model_path=None, vectorizer_path=None):
+    def _encode_labels(self, labels):
+        """
+        Encode category names as small integer class indices.
+
+        Integer arrays, such as the labels from
+        training_data.get_training_arrays(), are taken as already encoded
+        and only range-checked.
+
+        Args:
+            labels: Iterable of category names, or an integer array of
+                class indices
+
+        Returns:
+            np.int8 array of indices into self.categories
+        """
+        if isinstance(labels, np.ndarray) and labels.dtype.kind in 'iu':
+            if labels.size and (labels.min() < 0 or labels.max() >= len(self.categories)):
+                raise ValueError("Class index out of range for the configured categories")
+            return labels.astype(np.int8, copy=False)
+
+        class_index = {category: i for i, category in enumerate(self.categories)}
+        try:
+            return np.fromiter((class_index[label] for label in labels), dtype=np.int8)
+        except KeyError as e:
+            raise ValueError(f"Unknown category: {e.args[0]}") from None
+
+    def _restore_class_names(self):
+        """Map the fitted classifier's class indices back to category names."""
+        self.classifier.classes_ = np.asarray(self.categories)[self.classifier.classes_]
+
+    def _cast_parameters_float32(self):
+        """
+        Store the fitted log-probability parameters as float32.
+
+        Matches the float32 feature matrices, so prediction runs a
+        single-precision sparse-dense product and the saved model is
+        smaller. Count arrays stay float64 for further partial_fit calls.
+        """
+        for attr in ('feature_log_prob_', 'class_log_prior_'):
+            if hasattr(self.classifier, attr):
+                setattr(self.classifier, attr, getattr(self.classifier, attr).astype(np.float32))
+
+    def save_model(self, model_path=None, vectorizer_path=None, compress=0):
         """
         Save trained model and vectorizer.
 
+        Artifacts are uncompressed by default so the predictor can
+        memory-map their arrays. Compressed files are smaller to ship
+        but are loaded fully into memory.
+
         Args:
             model_path: Path to save classifier model
             vectorizer_path: Path to save vectorizer
+            compress: joblib compression level or (method, level) tuple
         """
         if not self.is_trained:
             raise ValueError("Model not trained yet")
@@ -186,17 +544,25 @@ class ClassifierTrainer:
         # Ensure directory exists
         os.makedirs(os.path.dirname(model_path), exist_ok=True)
 
+        model_data = {
+            'classifier': self.classifier,
+            'categories': self.categories,
+            'stats': self.training_stats,
+            'model_version': MODEL_VERSION
+        }
+        # Scoring weights in the layout the predictor multiplies with, so
+        # they can be memory-mapped and shared instead of copied per process
+        if isinstance(self.classifier, MultinomialNB):
+            model_data['feature_log_prob_T'] = np.ascontiguousarray(
+                self.classifier.feature_log_prob_.T, dtype=np.float32)
+            model_data['class_log_prior'] = np.asarray(
+                self.classifier.class_log_prior_, dtype=np.float32)
+
         # Save classifier
-        with open(model_path, 'wb') as f:
-            pickle.dump({
-                'classifier': self.classifier,
-                'categories': self.categories,
-                'stats': self.training_stats
-            }, f)
+        _dump_atomic(model_data, model_path, compress=compress)
 
         # Save vectorizer
-        with open(vectorizer_path, 'wb') as f:
-            pickle.dump(self.vectorizer, f)
+        _dump_atomic(self.vectorizer, vectorizer_path, compress=compress)
 
         print(f"Model saved to {model_path}")
         print(f"Vectorizer saved to {vectorizer_path}")
@@ -223,6 +589,11 @@ class ClassifierTrainer:
         report.append(f"Training Set Size: {stats.get('train_size', 0)}")
         report.append(f"Test Set Size: {stats.get('test_size', 0)}")
         report.append("")
+        if stats.get('incremental'):
+            report.append("Trained incrementally; no holdout evaluation.")
+            report.append("=" * 50)
+            return "\n".join(report)
+
         report.append(f"Test Accuracy: {stats.get('accuracy', 0):.4f}")
         report.append(f"Cross-Validation Mean: {stats.get('cv_mean', 0):.4f}")
         report.append(f"Cross-Validation Std: {stats.get('cv_std', 0):.4f}")
@@ -289,8 +660,8 @@ def save_sample_training_data():
 
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(samples, f, indent=2)
+    with open(filepath, 'wb') as f:
+        f.write(orjson.dumps(samples, option=orjson.OPT_INDENT_2))
 
     print(f"\n{'='*50}")
     print("TRAINING DATA SAVED")
@@ -301,10 +672,7 @@ def save_sample_training_data():
 
     # Count by category
     print("Samples per category:")
-    category_counts = {}
-    for sample in samples:
-        cat = sample['category']
-        category_counts[cat] = category_counts.get(cat, 0) + 1
+    category_counts = Counter(sample['category'] for sample in samples)
 
     for cat, count in sorted(category_counts.items()):
         print(f"  - {cat}: {count}")
@@ -20,12 +20,87 @@ including BBC News, Reuters, and other major news outlets.
 """
 import os
 import csv
+import sys
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
+
+import config
 
 
 # Get the directory where this module is located
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
 TRAINING_DATA_DIR = os.path.join(MODULE_DIR, 'training_data')
 
+# CSV files making up the corpus, one per category
+CSV_FILES = (
+    os.path.join(TRAINING_DATA_DIR, 'business_training_data.csv'),
+    os.path.join(TRAINING_DATA_DIR, 'entertainment_training_data.csv'),
+    os.path.join(TRAINING_DATA_DIR, 'health_training_data.csv'),
+)
+
+
+def _read_csv_rows(filepath):
+    """
+    Parse a training CSV file into (text, category, length_type) rows.
+
+    Args:
+        filepath: Path to the CSV file
+
+    Yields:
+        Tuples of (text, category, length_type)
+    """
+    if not os.path.exists(filepath):
+        print(f"Warning: Training data file not found: {filepath}")
+        return
+
+    with open(filepath, 'r', encoding='utf-8', newline='') as f:
+        # The schema is fixed, so index rows by column position instead
+        # of building a dict per row with csv.DictReader
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        text_col = header.index('text')
+        category_col = header.index('category')
+        length_col = header.index('length_type') if 'length_type' in header else None
+
+        for row in reader:
+            if len(row) <= max(text_col, category_col):
+                continue
+            text = row[text_col].strip()
+            category = row[category_col].strip()
+            if not (text and category):
+                continue
+
+            if length_col is not None and length_col < len(row):
+                length_type = row[length_col].strip()
+            else:
+                length_type = 'Long'
+            # Labels repeat on every row; intern them so all samples
+            # share one string object per label
+            length_type = sys.intern(length_type)
+            # Short phrases recur across the corpus, so duplicates
+            # share one object too
+            if length_type == 'Short':
+                text = sys.intern(text)
+            yield text, sys.intern(category), length_type
+
+
+def iter_csv_data(filepath):
+    """
+    Stream training samples from a CSV file.
+
+    Args:
+        filepath: Path to the CSV file
+
+    Yields:
+        Dictionaries with 'text', 'category', and 'length_type' keys
+    """
+    for text, category, length_type in _read_csv_rows(filepath):
+        yield {'text': text, 'category': category, 'length_type': length_type}
+
 
 def load_csv_data(filepath):
     """
@@ -37,50 +112,87 @@ def load_csv_data(filepath):
     Returns:
         List of dictionaries with 'text', 'category', and 'length_type' keys
     """
-    samples = []
+    return list(iter_csv_data(filepath))
 
-    if not os.path.exists(filepath):
-        print(f"Warning: Training data file not found: {filepath}")
-        return samples
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get('text') and row.get('category'):
-                samples.append({
-                    'text': row['text'].strip(),
-                    'category': row['category'].strip(),
-                    'length_type': row.get('length_type', 'Long').strip()
-                })
+@lru_cache(maxsize=1)
+def _load_corpus():
+    """
+    Parse every training CSV file once per process.
+
+    The corpus is kept as parallel columns rather than one dict per
+    sample; the public getters build whichever shape they return.
 
-    return samples
+    Returns:
+        Tuple of (texts, categories, length_types) tuples
+    """
+    rows = [row for csv_file in CSV_FILES for row in _read_csv_rows(csv_file)]
+    if not rows:
+        return (), (), ()
+    return tuple(zip(*rows))
 
 
 def get_training_data():
     """
     Get comprehensive training data for the classifier.
 
-    Loads data from CSV files in the training_data/ directory.
+    Loads data from CSV files in the training_data/ directory. Only the
+    parsed corpus is cached; each call builds fresh sample dicts, so
+    callers may modify the result.
 
     Returns:
         List of dictionaries with 'text' and 'category' keys
     """
-    samples = []
-
-    # Define CSV files to load
-    csv_files = [
-        os.path.join(TRAINING_DATA_DIR, 'business_training_data.csv'),
-        os.path.join(TRAINING_DATA_DIR, 'entertainment_training_data.csv'),
-        os.path.join(TRAINING_DATA_DIR, 'health_training_data.csv'),
+    texts, categories, _ = _load_corpus()
+    return [
+        {'text': text, 'category': category}
+        for text, category in zip(texts, categories)
     ]
 
-    # Load data from each CSV file
-    for csv_file in csv_files:
-        file_samples = load_csv_data(csv_file)
-        samples.extend(file_samples)
 
-    # Convert to the expected format (text and category only)
-    return [{'text': s['text'], 'category': s['category']} for s in samples]
+@lru_cache(maxsize=1)
+def get_training_arrays():
+    """
+    Get the training corpus as parallel arrays.
+
+    Labels are indices into the returned categories tuple, so the arrays
+    can be fed straight to sklearn and shuffled or split by index. Both
+    arrays are cached and read-only.
+
+    Returns:
+        Tuple of (texts, labels, categories): an object array of texts,
+        an int8 array of category indices, and the category names
+    """
+    categories = tuple(config.CLASSIFICATION_CATEGORIES)
+    category_index = {category: i for i, category in enumerate(categories)}
+    corpus_texts, corpus_categories, _ = _load_corpus()
+    keep = [i for i, category in enumerate(corpus_categories) if category in category_index]
+
+    texts = np.empty(len(keep), dtype=object)
+    texts[:] = [corpus_texts[i] for i in keep]
+    labels = np.fromiter((category_index[corpus_categories[i]] for i in keep),
+                         dtype=np.int8, count=len(keep))
+
+    texts.flags.writeable = False
+    labels.flags.writeable = False
+    return texts, labels, categories
+
+
+def iter_csv_training_pairs():
+    """
+    Stream (text, category) pairs straight from the CSV files.
+
+    For consumers that iterate once over the bundled CSV corpus; the
+    result can be passed to ClassifierTrainer.train_incremental(). Rows
+    are yielded as they are read, without building sample dicts or
+    populating the per-process cache.
+
+    Yields:
+        Tuples of (text, category)
+    """
+    for csv_file in CSV_FILES:
+        for text, category, _ in _read_csv_rows(csv_file):
+            yield text, category
 
 
 def get_training_data_with_length():
@@ -90,19 +202,20 @@ def get_training_data_with_length():
     Returns:
         List of dictionaries with 'text', 'category', and 'length_type' keys
     """
-    samples = []
-
-    csv_files = [
-        os.path.join(TRAINING_DATA_DIR, 'business_training_data.csv'),
-        os.path.join(TRAINING_DATA_DIR, 'entertainment_training_data.csv'),
-        os.path.join(TRAINING_DATA_DIR, 'health_training_data.csv'),
+    return [
+        {'text': text, 'category': category, 'length_type': length_type}
+        for text, category, length_type in zip(*_load_corpus())
     ]
 
-    for csv_file in csv_files:
-        file_samples = load_csv_data(csv_file)
-        samples.extend(file_samples)
 
-    return samples
+def clear_caches():
+    """
+    Drop the cached corpus so the next call re-reads the CSV files.
+
+    Use after editing the training CSVs in a running process.
+    """
+    _load_corpus.cache_clear()
+    get_training_arrays.cache_clear()
 
 
 def get_data_statistics(samples=None):
@@ -110,37 +223,37 @@ def get_data_statistics(samples=None):
     Get statistics about the training data.
 
     Args:
-        samples: Optional list of samples. If None, loads from CSV files.
+        samples: Optional iterable of samples. If None, counts the cached
+            CSV corpus directly without building sample dicts.
 
     Returns:
         Dictionary with total count and breakdown by category and length type
     """
     if samples is None:
-        samples = get_training_data_with_length()
-
-    stats = {
-        "total": len(samples),
-        "by_category": {},
-        "by_length_type": {},
-        "by_category_and_length": {}
+        _, categories, length_types = _load_corpus()
+        pairs = Counter(zip(categories, length_types))
+    else:
+        pairs = Counter(
+            (sample.get("category", "Unknown"), sample.get("length_type", "Unknown"))
+            for sample in samples
+        )
+
+    # Per-category and per-length counts are folded from the pair counts
+    by_category = Counter()
+    by_length_type = Counter()
+    for (cat, length), count in pairs.items():
+        by_category[cat] += count
+        by_length_type[length] += count
+
+    return {
+        "total": sum(pairs.values()),
+        "by_category": dict(by_category),
+        "by_length_type": dict(by_length_type),
+        "by_category_and_length": {
+            f"{cat}_{length}": count for (cat, length), count in pairs.items()
+        }
     }
 
-    for sample in samples:
-        cat = sample.get("category", "Unknown")
-        length = sample.get("length_type", "Unknown")
-
-        # Count by category
-        stats["by_category"][cat] = stats["by_category"].get(cat, 0) + 1
-
-        # Count by length type
-        stats["by_length_type"][length] = stats["by_length_type"].get(length, 0) + 1
-
-        # Count by category and length
-        key = f"{cat}_{length}"
-        stats["by_category_and_length"][key] = stats["by_category_and_length"].get(key, 0) + 1
-
-    return stats
-
 
 def print_data_summary():
     """Print a summary of the training data."""
@@ -2,6 +2,8 @@
 Configuration settings for the Vertical Search Engine
 """
 import os
+from types import MappingProxyType
+
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -26,16 +28,26 @@ CRAWLER_TIMEOUT = 30  # Page load timeout in seconds
 
 # Search settings
 SEARCH_RESULTS_LIMIT = 100  # Maximum results when not using pagination
-FIELD_WEIGHTS = {
+# Read-only; components that need their own weights take a copy
+FIELD_WEIGHTS = MappingProxyType({
     'title': 3.0,
     'authors': 2.5,
     'keywords': 2.0,
     'year': 1.5,
     'abstract': 1.0
-}
+})
 
 # Classification categories
-CLASSIFICATION_CATEGORIES = ['Business', 'Entertainment', 'Health']
+CLASSIFICATION_CATEGORIES = ('Business', 'Entertainment', 'Health')
+
+# Preprocessed-token cache: corpus versions kept on disk by the trainer
+TOKEN_CACHE_MAX_ITEMS = 3
+
+# Worker processes for classifier training (-1 = all cores). Training
+# started from the web app stays in-process so no worker pool is spawned
+# from a request thread
+CLASSIFIER_N_JOBS = -1
+WEB_CLASSIFIER_N_JOBS = 1
 
 # Flask settings
 FLASK_DEBUG = True
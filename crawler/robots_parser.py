@@ -3,9 +3,43 @@ robots.txt Parser for polite crawling
 
 Respects website crawling policies by parsing and following robots.txt rules.
 """
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, urljoin
 from urllib.robotparser import RobotFileParser
+from urllib3.util.retry import Retry
+
+# Seconds a successfully loaded robots.txt is reused by get_or_create()
+ROBOTS_CACHE_TTL = 24 * 60 * 60
+
+# Shared parsers keyed by (scheme, netloc, user_agent)
+_robots_cache = {}
+_robots_cache_lock = threading.Lock()
+
+
+def _create_session():
+    """
+    Create the pooled HTTP session used for robots.txt fetches.
+
+    Returns:
+        requests.Session with a browser User-Agent (plain clients get a 403)
+        and a couple of retries on connection errors
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    })
+    adapter = HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Shared so repeated fetches reuse pooled keep-alive connections
+_session = _create_session()
 
 
 class RobotsParser:
@@ -26,6 +60,43 @@ class RobotsParser:
         self.parser = RobotFileParser()
         self.crawl_delay = 1  # Default delay in seconds
         self._loaded = False
+        self._load_ok = False
+        self._loaded_at = None
+        self._load_lock = threading.Lock()
+
+    @classmethod
+    def get_or_create(cls, base_url, user_agent='*'):
+        """
+        Get a shared parser for a site, fetching robots.txt at most once a day.
+
+        Parsers are shared across crawler instances in this process. A
+        parser whose robots.txt could not be loaded is not reused, so the
+        next crawl retries the fetch.
+
+        Args:
+            base_url: Base URL of the website
+            user_agent: User agent string to check permissions for
+
+        Returns:
+            RobotsParser instance
+        """
+        parsed = urlparse(base_url)
+        key = (parsed.scheme, parsed.netloc, user_agent)
+
+        with _robots_cache_lock:
+            parser = _robots_cache.get(key)
+            if parser is None or parser._is_stale():
+                parser = cls(base_url, user_agent)
+                _robots_cache[key] = parser
+            return parser
+
+    def _is_stale(self):
+        """Check whether a loaded robots.txt should be fetched again."""
+        if not self._loaded:
+            return False
+        if not self._load_ok:
+            return True
+        return time.monotonic() - self._loaded_at > ROBOTS_CACHE_TTL
 
     # def load(self):
     #     """
@@ -62,11 +133,8 @@ class RobotsParser:
             parsed = urlparse(self.base_url)
             robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
             
-            # Use requests with a proper User-Agent header
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            response = requests.get(robots_url, headers=headers, timeout=10)
+            # The shared session sends a browser User-Agent header
+            response = _session.get(robots_url, timeout=10)
             
             if response.status_code == 200:
                 # Split the text into lines and parse
@@ -77,23 +145,43 @@ class RobotsParser:
                 if delay:
                     self.crawl_delay = delay
                 
-                self._loaded = True
+                self._mark_loaded(True)
                 return True
             elif response.status_code == 404:
                 # If robots.txt doesn't exist, all is allowed
-                self._loaded = True
+                self._mark_loaded(True)
                 return True
             else:
                 # If we get a 403 or other error, Python's RobotFileParser 
                 # defaults to disallowing everything. 
                 print(f"Warning: robots.txt returned status {response.status_code}")
-                self._loaded = True
+                self._mark_loaded(False)
                 return False
 
         except Exception as e:
             print(f"Warning: Could not load robots.txt: {e}")
-            self._loaded = True
+            self._mark_loaded(False)
             return False
+
+    def _ensure_loaded(self):
+        """
+        Load robots.txt on first use.
+
+        Shared parsers are used from several crawl threads, so the fetch
+        is guarded to happen only once.
+        """
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self.load()
+
+    def _mark_loaded(self, ok):
+        """Record the outcome and time of a load attempt."""
+        self._loaded = True
+        self._load_ok = ok
+        self._loaded_at = time.monotonic()
+
     def can_fetch(self, url):
         """
         Check if a URL can be fetched according to robots.txt.
@@ -104,8 +192,7 @@ class RobotsParser:
         Returns:
             True if allowed, False otherwise
         """
-        if not self._loaded:
-            self.load()
+        self._ensure_loaded()
 
         try:
             return self.parser.can_fetch(self.user_agent, url)
@@ -120,8 +207,7 @@ class RobotsParser:
         Returns:
             Crawl delay in seconds
         """
-        if not self._loaded:
-            self.load()
+        self._ensure_loaded()
 
         return self.crawl_delay
 
@@ -132,8 +218,7 @@ class RobotsParser:
         Returns:
             List of sitemap URLs
         """
-        if not self._loaded:
-            self.load()
+        self._ensure_loaded()
 
         try:
             return self.parser.site_maps() or []
@@ -6,13 +6,14 @@ from the Research Centre for Computational Science and Mathematical Modelling.
 """
 
 import re
+import threading
 import time
-import json
 import os
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -20,7 +21,9 @@ from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.edge.service import Service as EdgeService
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import orjson
+import requests
 
 try:
     from webdriver_manager.chrome import ChromeDriverManager
@@ -31,6 +34,73 @@ except ImportError:
 
 from crawler.robots_parser import RobotsParser
 import config
+
+# Precompiled patterns for matching PURE portal markup
+PERSON_ITEM_CLASS_PATTERN = re.compile(r'rendering|person|result-container')
+PERSON_LINK_PATTERN = re.compile(r'/en/persons/')
+PERSON_SLUG_PATTERN = re.compile(r'/en/persons/[\w-]+')
+RESULT_CONTAINER_PATTERN = re.compile(r'result-container')
+TITLE_LINK_CLASS_PATTERN = re.compile(r'title|link')
+PUBLICATION_LINK_PATTERN = re.compile(r'/publications/')
+YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+PUBLICATION_CONTENT_CLASS_PATTERN = re.compile(r'content-content.*publication-content')
+ABSTRACT_RENDERING_CLASS_PATTERN = re.compile(r'rendering.*abstractportal')
+NEXT_LABEL_PATTERN = re.compile(r'Next', re.IGNORECASE)
+
+# Publication detail pages are parsed only within the content block
+# holding the abstract; the rest of the page is skipped
+PUBLICATION_CONTENT_STRAINER = SoupStrainer('div', class_=re.compile(r'content-content'))
+
+# Page text showing a request was answered with a Cloudflare challenge
+CHALLENGE_MARKERS = ('verifying you are human', 'just a moment', 'checking your browser')
+# Response codes Cloudflare answers with when it blocks or rate-limits
+CHALLENGE_STATUS_CODES = frozenset({403, 429, 503})
+
+# Title or visible text shown while Cloudflare verification is in progress
+CLOUDFLARE_INDICATORS = (
+    'checking your browser',
+    'verifying you are human',
+    'just a moment',
+    'cloudflare',
+    'please wait',
+    'ddos protection'
+)
+
+# Resources the crawler never needs; blocked in the browser to save
+# downloads on every page. Stylesheets are kept so a Cloudflare CAPTCHA
+# still renders for manual solving
+BLOCKED_RESOURCE_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*'
+]
+
+# Earliest time.monotonic() at which the next page request may start.
+# Shared by all crawler instances so concurrent crawls keep one politeness
+# budget for the portal
+_next_request_at = 0.0
+_request_slot_lock = threading.Lock()
+
+
+def wait_for_request_slot(delay):
+    """
+    Block until the next page request may start, then reserve it.
+
+    Requests start at least `delay` seconds apart; time spent loading the
+    previous page counts towards the delay instead of being added to it.
+
+    Args:
+        delay: Minimum seconds between the starts of consecutive requests
+    """
+    global _next_request_at
+    with _request_slot_lock:
+        wait = _next_request_at - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _next_request_at = time.monotonic() + delay
+
+
 crawler_log= []
 def log_message(msg):
     """Add message to crawler log."""
@@ -55,8 +125,19 @@ class PUREPortalCrawler:
         self.publications = []
         self.visited_urls = set()
         self.author_profiles = {}
+        # Lowercased titles and links of collected publications, for dedup
+        self._seen_titles = set()
+        self._seen_links = set()
+        # Abstract text by publication URL; co-authored publications are
+        # listed on several profiles but fetched once
+        self._abstract_cache = {}
+        # HTTP session replaying the browser's cookies, created on first
+        # use; disabled once it is challenged, so later pages go back
+        # through Selenium
+        self.http_session = None
+        self._http_session_disabled = False
         self.base_url = config.CRAWLER_BASE_URL
-        self.robots_parser = RobotsParser(self.base_url)
+        self.robots_parser = RobotsParser.get_or_create(self.base_url)
 
         # Detailed crawl metrics
         self.crawl_metrics = {
@@ -71,6 +152,9 @@ class PUREPortalCrawler:
             'pages_crawled_per_author': {},  # {author_name: page_count}
             'authors_per_publication': {},  # {pub_title: author_count}
         }
+        # (pub_title, author) pairs already in publication_authors_map, so
+        # the per-title author lists stay JSON lists without linear scans
+        self._publication_author_pairs = set()
 
     def log(self, message):
         """Log a message via callback or print."""
@@ -101,12 +185,18 @@ class PUREPortalCrawler:
 
         chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        # --disable-images is ignored by current Chrome; block via content settings
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
 
 
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
             
             self.driver.set_page_load_timeout(config.CRAWLER_TIMEOUT)
+            self._block_resources()
 
             self.log("Chrome WebDriver initialized successfully")
             return True
@@ -117,6 +207,11 @@ class PUREPortalCrawler:
         
     def close_driver(self):
         """Close the WebDriver."""
+        if self.http_session is not None:
+            self.http_session.close()
+        self.http_session = None
+        self._http_session_disabled = False
+
         if self.driver:
             try:
                 self.driver.quit()
@@ -124,6 +219,14 @@ class PUREPortalCrawler:
             except Exception:
                 pass
         
+    def _block_resources(self):
+        """Block images, fonts, media and analytics requests via CDP."""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_URLS})
+        except Exception as e:
+            self.log(f"Could not block page resources: {e}")
+
     def extract_author_profiles(self, soup:BeautifulSoup):
         """
         Extract author profile links from the persons page.
@@ -138,10 +241,10 @@ class PUREPortalCrawler:
 
         # Look for person links - PURE portal uses specific patterns
         # Method 1: Look for person list items
-        person_items = soup.find_all('div', class_=re.compile(r'rendering|person|result-container'))
+        person_items = soup.find_all('div', class_=PERSON_ITEM_CLASS_PATTERN)
         
         for item in person_items:
-            link = item.find('a', href=re.compile(r'/en/persons/'))
+            link = item.find('a', href=PERSON_LINK_PATTERN)
             if link:
                 name = link.get_text(strip=True)
                 url = urljoin(self.base_url, link.get('href'))
@@ -150,7 +253,7 @@ class PUREPortalCrawler:
 
         # Method 2: Direct link search
         if not profiles:
-            for link in soup.find_all('a', href=re.compile(r'/en/persons/[\w-]+')):
+            for link in soup.find_all('a', href=PERSON_SLUG_PATTERN):
                 href = link.get('href', '')
                 if '/persons/' in href and '/publications' not in href:
                     name = link.get_text(strip=True)
@@ -184,7 +287,7 @@ class PUREPortalCrawler:
         # commented out the code that was looking for various class name , instead we only go for div with class name
         # "result-container"
         pub_containers = soup.find_all(['li', 'div', 'article'],
-            class_=re.compile(r'result-container'))
+            class_=RESULT_CONTAINER_PATTERN)
 
         for container in pub_containers:
             try:
@@ -196,14 +299,14 @@ class PUREPortalCrawler:
                     pub_title = pub['title'].lower().strip()
 
                     # Track which authors have this publication
-                    if pub_title not in self.crawl_metrics['publication_authors_map']:
-                        self.crawl_metrics['publication_authors_map'][pub_title] = []
-                    if author_name not in self.crawl_metrics['publication_authors_map'][pub_title]:
-                        self.crawl_metrics['publication_authors_map'][pub_title].append(author_name)
+                    if (pub_title, author_name) not in self._publication_author_pairs:
+                        self._publication_author_pairs.add((pub_title, author_name))
+                        self.crawl_metrics['publication_authors_map'].setdefault(pub_title, []).append(author_name)
 
                     # Check for duplicates
-                    if not self._is_duplicate(pub):
+                    if not self._is_duplicate(pub, pub_title):
                         publications.append(pub)
+                        self._register_publication(pub, pub_title)
                         author_unique += 1
                     else:
                         author_duplicates += 1
@@ -252,9 +355,9 @@ class PUREPortalCrawler:
         # Extract title - look for heading or main link
         title_elem = container.find(['h3', 'h4', 'h2'])
         if not title_elem:
-            title_elem = container.find('a', class_=re.compile(r'title|link'))
+            title_elem = container.find('a', class_=TITLE_LINK_CLASS_PATTERN)
         if not title_elem:
-            title_link = container.find('a', href=re.compile(r'/publications/'))
+            title_link = container.find('a', href=PUBLICATION_LINK_PATTERN)
             if title_link:
                 title_elem = title_link
 
@@ -271,7 +374,7 @@ class PUREPortalCrawler:
 
         # Extract year
         text = container.get_text()
-        year_match = re.search(r'\b(19|20)\d{2}\b', text)
+        year_match = YEAR_PATTERN.search(text)
         if year_match:
             pub['year'] = year_match.group()
 
@@ -281,7 +384,7 @@ class PUREPortalCrawler:
         'a',
         attrs={
             'class': 'link person',
-            'href': re.compile(r'/en/persons/')
+            'href': PERSON_LINK_PATTERN
         }
         )
 
@@ -291,9 +394,10 @@ class PUREPortalCrawler:
             if name and name not in pub['authors']:
                 pub['authors'].append(name)
                 pub['author_profiles'][name] = url
-        else:
+
+        if not pub['authors']:
             # Try to find author links directly
-            author_links = container.find_all('a', href=re.compile(r'/en/persons/'))
+            author_links = container.find_all('a', href=PERSON_LINK_PATTERN)
             for link in author_links:
                 name = link.get_text(strip=True)
                 url = urljoin(self.base_url, link.get('href', ''))
@@ -318,19 +422,50 @@ class PUREPortalCrawler:
         """
         Extract abstract from a publication's detail page.
 
+        Results are cached per URL; failed fetches are retried next time.
+
         Args:
             publication_url: URL of the publication
 
         Returns:
             Abstract text or empty string if not found
         """
+        if publication_url in self._abstract_cache:
+            return self._abstract_cache[publication_url]
+
+        abstract = self._fetch_abstract(publication_url)
+        if abstract is None:
+            return ''
+        self._abstract_cache[publication_url] = abstract
+        return abstract
+
+    def _fetch_abstract(self, publication_url):
+        """
+        Fetch a publication's detail page and extract its abstract.
+
+        Args:
+            publication_url: URL of the publication
+
+        Returns:
+            Abstract text, empty string if the page has none, or None if
+            the page could not be fetched
+        """
+        # Checked once here: get_page_via_session() relies on it, and a
+        # blocked page should not be retried through the browser
+        if not self.robots_parser.can_fetch(publication_url):
+            self.log(f"  Blocked by robots.txt: {publication_url}")
+            return ''
+
         try:
-            soup = self.get_page(publication_url)
-            if not soup:
-                return ''
+            # Only the publication content block is needed from the page
+            soup = self.get_page_via_session(publication_url, parse_only=PUBLICATION_CONTENT_STRAINER)
+            if soup is None:
+                soup = self.get_page(publication_url, parse_only=PUBLICATION_CONTENT_STRAINER)
+            if soup is None:
+                return None
 
             # Look for div with class "content-content publication-content"
-            content_div = soup.find('div', class_=re.compile(r'content-content.*publication-content'))
+            content_div = soup.find('div', class_=PUBLICATION_CONTENT_CLASS_PATTERN)
             if not content_div:
                 return ''
 
@@ -340,7 +475,7 @@ class PUREPortalCrawler:
                 return ''
 
             # Get the next sibling div (or find the rendering div nearby)
-            abstract_container = abstract_header.find_next('div', class_=re.compile(r'rendering.*abstractportal'))
+            abstract_container = abstract_header.find_next('div', class_=ABSTRACT_RENDERING_CLASS_PATTERN)
             if not abstract_container:
                 return ''
 
@@ -356,16 +491,39 @@ class PUREPortalCrawler:
 
         except Exception as e:
             self.log(f"    Error extracting abstract from {publication_url}: {e}")
-            return ''
+            return None
 
-    def _is_duplicate(self, pub):
-        """Check if publication is already collected."""
-        for existing in self.publications:
-            if existing['title'].lower() == pub['title'].lower():
-                return True
-            if existing['publication_link'] and existing['publication_link'] == pub['publication_link']:
-                return True
-        return False
+    def _is_duplicate(self, pub, title_key=None):
+        """
+        Check if publication is already collected.
+
+        Args:
+            pub: Publication dictionary
+            title_key: The title lowercased and stripped, if already computed
+
+        Returns:
+            True if a publication with the same title or link was collected
+        """
+        if title_key is None:
+            title_key = pub['title'].lower().strip()
+        if title_key in self._seen_titles:
+            return True
+        return bool(pub['publication_link']) and pub['publication_link'] in self._seen_links
+
+    def _register_publication(self, pub, title_key=None):
+        """Record a collected publication's title and link for _is_duplicate()."""
+        if title_key is None:
+            title_key = pub['title'].lower().strip()
+        self._seen_titles.add(title_key)
+        if pub['publication_link']:
+            self._seen_links.add(pub['publication_link'])
+
+    def _reset_seen(self):
+        """Rebuild the dedup sets from self.publications."""
+        self._seen_titles = set()
+        self._seen_links = set()
+        for pub in self.publications:
+            self._register_publication(pub)
 
     def get_next_page_link(self, soup):
         """
@@ -391,12 +549,82 @@ class PUREPortalCrawler:
             return urljoin(self.base_url, next_link.get('href'))
 
         # Another pattern: look for aria-label containing "Next"
-        next_link = soup.find('a', attrs={'aria-label': re.compile(r'Next', re.IGNORECASE)})
+        next_link = soup.find('a', attrs={'aria-label': NEXT_LABEL_PATTERN})
         if next_link and next_link.get('href'):
             return urljoin(self.base_url, next_link.get('href'))
 
         return None
 
+    def _request_delay(self):
+        """
+        Get the politeness delay between page requests.
+
+        Returns:
+            The larger of CRAWLER_DELAY and the robots.txt crawl delay
+        """
+        return max(config.CRAWLER_DELAY, self.robots_parser.get_crawl_delay())
+
+    def _create_http_session(self):
+        """
+        Create an HTTP session carrying the browser's cookies and User-Agent.
+
+        Once the browser has passed Cloudflare, its clearance cookie lets
+        plain HTTP requests fetch static pages without a full navigation.
+
+        Returns:
+            requests.Session
+        """
+        session = requests.Session()
+        session.headers['User-Agent'] = self.driver.execute_script('return navigator.userAgent')
+        for cookie in self.driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'],
+                                domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        return session
+
+    def get_page_via_session(self, url, parse_only=None):
+        """
+        Fetch a page over HTTP with the browser's session cookies.
+
+        The caller must check robots.txt first. Returns None when the
+        request fails, is challenged or gets an error status, so the caller
+        should use Selenium; only after a challenge (a blocking status code
+        or challenge page) is the session not tried again for this crawl.
+
+        Args:
+            url: URL to fetch
+            parse_only: Optional SoupStrainer limiting which parts of the
+                page are parsed
+
+        Returns:
+            BeautifulSoup object or None
+        """
+        if self._http_session_disabled or not self.driver:
+            return None
+
+        try:
+            if self.http_session is None:
+                self.http_session = self._create_http_session()
+            wait_for_request_slot(self._request_delay())
+            response = self.http_session.get(url, timeout=config.CRAWLER_TIMEOUT)
+        except Exception as e:
+            self.log(f"  HTTP fetch failed for {url}, using browser: {e}")
+            return None
+
+        page_start = response.text[:4096].lower()
+        if (response.status_code in CHALLENGE_STATUS_CODES
+                or any(m in page_start for m in CHALLENGE_MARKERS)):
+            self.log("  HTTP session was challenged, using browser for remaining pages")
+            self.http_session.close()
+            self.http_session = None
+            self._http_session_disabled = True
+            return None
+
+        if response.status_code != 200:
+            self.log(f"  HTTP {response.status_code} for {url}, using browser")
+            return None
+
+        return BeautifulSoup(response.content, 'lxml', parse_only=parse_only)
+
     def crawl_all_author_publications(self, author_name, profile_url, max_pages=10):
         """
         Crawl all publications from an author's profile, handling pagination.
@@ -427,7 +655,7 @@ class PUREPortalCrawler:
                 self.log(f"    Page {page_num}: {current_url} is stuck in cloudflare verification, retrying...")
                 time.sleep(10)
                 self.driver.get(current_url)
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+                soup = BeautifulSoup(self.driver.page_source, 'lxml')
                 if not soup:
                     break
 
@@ -482,48 +710,37 @@ class PUREPortalCrawler:
             True if verification passed, False if timed out
         """
         self.log("  Detecting Cloudflare verification...")
-        start_time = time.time()
 
-        while time.time() - start_time < max_wait:
-            try:
-                page_source = self.driver.page_source.lower()
-                page_title = self.driver.title.lower()
-
-                # Check if we're still on Cloudflare page
-                cloudflare_indicators = [
-                    'checking your browser',
-                    'verifying you are human',
-                    'just a moment',
-                    'cloudflare',
-                    'please wait',
-                    'ddos protection'
-                ]
-
-                is_cloudflare = any(indicator in page_source or indicator in page_title
-                                   for indicator in cloudflare_indicators)
-
-                if not is_cloudflare:
-                    self.log("  Cloudflare verification passed!")
-                    return True
-
-                # Still on Cloudflare page, wait and check again
-                self.log(f"  Waiting for Cloudflare... ({int(time.time() - start_time)}s)")
-                time.sleep(3)
+        def verification_passed(driver):
+            # Only the title and visible text are pulled from the browser,
+            # not the whole serialized page source
+            page_text = driver.execute_script(
+                "return document.title + ' ' + (document.body ? document.body.innerText : '');"
+            ).lower()
+            return not any(indicator in page_text for indicator in CLOUDFLARE_INDICATORS)
 
-            except Exception as e:
-                self.log(f"  Error checking Cloudflare: {e}")
-                time.sleep(2)
+        try:
+            WebDriverWait(
+                self.driver, max_wait, poll_frequency=0.5,
+                ignored_exceptions=(WebDriverException,)
+            ).until(verification_passed)
+            self.log("  Cloudflare verification passed!")
+            return True
+        except TimeoutException:
+            pass
 
         self.log("  WARNING: Cloudflare verification timed out. You may need to solve CAPTCHA manually.")
         return False
     
-    def get_page(self, url, is_first_request=False):
+    def get_page(self, url, is_first_request=False, parse_only=None):
         """
         Fetch a page using Selenium.
 
         Args:
             url: URL to fetch
             is_first_request: If True, wait longer for Cloudflare
+            parse_only: Optional SoupStrainer limiting which parts of the
+                page are parsed
 
         Returns:
             BeautifulSoup object or None if failed
@@ -534,6 +751,7 @@ class PUREPortalCrawler:
             return None
 
         try:
+            wait_for_request_slot(self._request_delay())
             self.driver.get(url)
             self.wait_for_page_load()
 
@@ -545,11 +763,7 @@ class PUREPortalCrawler:
                     self.log("  Waiting 30 more seconds for manual verification...")
                     time.sleep(30)
 
-            # Respect crawl delay
-            delay = max(config.CRAWLER_DELAY, self.robots_parser.get_crawl_delay())
-            time.sleep(delay)
-
-            return BeautifulSoup(self.driver.page_source, 'html.parser')
+            return BeautifulSoup(self.driver.page_source, 'lxml', parse_only=parse_only)
 
         except Exception as e:
             self.log(f"  Error fetching {url}: {e}")
@@ -571,6 +785,7 @@ class PUREPortalCrawler:
 
         self.publications = []
         self.visited_urls = set()
+        self._reset_seen()
 
         self.log("=" * 60)
         self.log("Starting PURE Portal Crawler")
@@ -595,7 +810,7 @@ class PUREPortalCrawler:
             self.driver.get(f"{config.CRAWLER_PERSONS_URL}")
             time.sleep(20)
 
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            soup = BeautifulSoup(self.driver.page_source, 'lxml')
             
             if not soup:
                 self.log("Failed to load persons page")
@@ -717,8 +932,8 @@ class PUREPortalCrawler:
             'author_profiles': self.author_profiles
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
         self.log(f"Data saved to {filepath}")
 
@@ -736,11 +951,17 @@ class PUREPortalCrawler:
             filepath = config.PUBLICATIONS_FILE
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
 
             self.publications = data.get('publications', [])
             self.author_profiles = data.get('author_profiles', {})
+            self._reset_seen()
+            self._abstract_cache.update(
+                (pub['publication_link'], pub['abstract'])
+                for pub in self.publications
+                if pub.get('publication_link') and pub.get('abstract')
+            )
 
             self.log(f"Loaded {len(self.publications)} publications from {filepath}")
             return self.publications
@@ -748,7 +969,7 @@ class PUREPortalCrawler:
         except FileNotFoundError:
             self.log(f"Data file not found: {filepath}")
             return []
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.log(f"Error parsing data file: {e}")
             return []
 
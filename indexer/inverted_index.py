@@ -38,7 +38,7 @@ class InvertedIndex:
         self.total_docs = 0
         self.avg_doc_length = 0
 
-        self.field_weights = field_weights or config.FIELD_WEIGHTS
+        self.field_weights = dict(field_weights or config.FIELD_WEIGHTS)
         self.preprocessor = TextPreprocessor(
             use_stemming=True,
             use_lemmatization=True,
@@ -49,6 +49,7 @@ class InvertedIndex:
         self.term_doc_freq = defaultdict(int)  # term -> number of docs containing term
         self.created_at = None
         self.last_updated = None
+        self._stats_cache = None  # memoized get_statistics(), reset on mutation
 
     def add_document(self, doc_id, doc_data):
         """
@@ -65,6 +66,7 @@ class InvertedIndex:
                 - publication_link: URL to publication
                 - author_profiles: Dict of author -> profile URL
         """
+        self._stats_cache = None
         self.documents[doc_id] = doc_data
         self.doc_field_lengths[doc_id] = {}
 
@@ -245,6 +247,7 @@ class InvertedIndex:
             self.add_document(idx, pub)
 
         self.last_updated = datetime.now().isoformat()
+        self._stats_cache = None
 
     def clear(self):
         """Clear the entire index."""
@@ -255,6 +258,7 @@ class InvertedIndex:
         self.term_doc_freq.clear()
         self.total_docs = 0
         self.avg_doc_length = 0
+        self._stats_cache = None
 
     def get_all_terms(self):
         """
@@ -269,17 +273,22 @@ class InvertedIndex:
         """
         Get index statistics.
 
+        The result is cached until the index is next modified, since this
+        is called on every template render.
+
         Returns:
             Dictionary of statistics
         """
-        return {
-            'total_documents': self.total_docs,
-            'total_terms': len(self.index),
-            'average_doc_length': round(self.avg_doc_length, 2),
-            'created_at': self.created_at,
-            'last_updated': self.last_updated,
-            'field_weights': self.field_weights
-        }
+        if self._stats_cache is None:
+            self._stats_cache = {
+                'total_documents': self.total_docs,
+                'total_terms': len(self.index),
+                'average_doc_length': round(self.avg_doc_length, 2),
+                'created_at': self.created_at,
+                'last_updated': self.last_updated,
+                'field_weights': self.field_weights
+            }
+        return self._stats_cache
 
     def save(self, filepath=None):
         """
@@ -334,9 +343,10 @@ class InvertedIndex:
             self.term_doc_freq = defaultdict(int, data.get('term_doc_freq', {}))
             self.total_docs = data.get('total_docs', 0)
             self.avg_doc_length = data.get('avg_doc_length', 0)
-            self.field_weights = data.get('field_weights', config.FIELD_WEIGHTS)
+            self.field_weights = data.get('field_weights') or dict(config.FIELD_WEIGHTS)
             self.created_at = data.get('created_at')
             self.last_updated = data.get('last_updated')
+            self._stats_cache = None
 
             return True
 
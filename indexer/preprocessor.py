@@ -10,12 +10,36 @@ Implements:
 - Synonym expansion (WordNet)
 """
 import re
+from functools import lru_cache
+
 import nltk
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords, wordnet
 from nltk.stem import PorterStemmer, WordNetLemmatizer
 from nltk import pos_tag
 
+# Patterns used by clean_text, compiled once at import
+URL_PATTERN = re.compile(r'https?://\S+|www\.\S+')
+EMAIL_PATTERN = re.compile(r'\S+@\S+')
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+# Fallback stopwords if NLTK data not available
+_FALLBACK_STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for',
+    'from', 'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on',
+    'or', 'that', 'the', 'to', 'was', 'will', 'with', 'this',
+    'but', 'they', 'have', 'had', 'what', 'when', 'where',
+    'who', 'why', 'how', 'all', 'each', 'every', 'both', 'few',
+    'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
+    'only', 'same', 'so', 'than', 'too', 'very', 'can', 'just',
+    'should', 'now', 'i', 'we', 'you', 'he', 'she', 'them',
+    'their', 'there', 'here', 'about', 'after', 'before',
+    'above', 'below', 'between', 'during', 'through', 'into'
+})
+
+
 # Download required NLTK data
 def download_nltk_data():
     """Download required NLTK resources"""
@@ -35,6 +59,28 @@ def download_nltk_data():
             print(f"Warning: Could not download {resource}: {e}")
 
 
+_stop_words = None
+
+
+def _load_stop_words():
+    """
+    Load the English stopword list once per process.
+
+    The fallback is not cached, so a later call retries NLTK once its
+    data has been downloaded.
+
+    Returns:
+        Frozenset of NLTK's English stopwords, or a built-in fallback
+    """
+    global _stop_words
+    if _stop_words is None:
+        try:
+            _stop_words = frozenset(stopwords.words('english'))
+        except Exception:
+            return _FALLBACK_STOP_WORDS
+    return _stop_words
+
+
 class TextPreprocessor:
     """
     Text preprocessing class that provides various NLP operations
@@ -61,24 +107,11 @@ class TextPreprocessor:
         # Initialize tools
         self.stemmer = PorterStemmer()
         self.lemmatizer = WordNetLemmatizer()
+        # WordNet morphology lookups repeat for the same (word, pos) pairs
+        self._lemmatize_word = lru_cache(maxsize=65536)(self.lemmatizer.lemmatize)
 
-        # Load stopwords
-        try:
-            self.stop_words = set(stopwords.words('english'))
-        except:
-            # Fallback stopwords if NLTK data not available
-            self.stop_words = {
-                'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for',
-                'from', 'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on',
-                'or', 'that', 'the', 'to', 'was', 'will', 'with', 'this',
-                'but', 'they', 'have', 'had', 'what', 'when', 'where',
-                'who', 'why', 'how', 'all', 'each', 'every', 'both', 'few',
-                'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'not',
-                'only', 'same', 'so', 'than', 'too', 'very', 'can', 'just',
-                'should', 'now', 'i', 'we', 'you', 'he', 'she', 'them',
-                'their', 'there', 'here', 'about', 'after', 'before',
-                'above', 'below', 'between', 'during', 'through', 'into'
-            }
+        # Load stopwords (shared by every instance in the process)
+        self.stop_words = _load_stop_words()
 
     def clean_text(self, text):
         """
@@ -97,19 +130,19 @@ class TextPreprocessor:
         text = text.lower()
 
         # Remove URLs
-        text = re.sub(r'https?://\S+|www\.\S+', '', text)
+        text = URL_PATTERN.sub('', text)
 
         # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
+        text = EMAIL_PATTERN.sub('', text)
 
         # Remove special characters but keep alphanumeric and spaces
-        text = re.sub(r'[^\w\s]', ' ', text)
+        text = SPECIAL_CHAR_PATTERN.sub(' ', text)
 
         # Remove numbers (optional - keep for year matching)
         # text = re.sub(r'\d+', '', text)
 
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = WHITESPACE_PATTERN.sub(' ', text).strip()
 
         return text
 
@@ -197,12 +230,12 @@ class TextPreprocessor:
             lemmatized = []
             for word, tag in pos_tags:
                 pos = self.get_wordnet_pos(tag)
-                lemmatized.append(self.lemmatizer.lemmatize(word, pos))
+                lemmatized.append(self._lemmatize_word(word, pos))
 
             return lemmatized
         except:
             # Fallback without POS tagging
-            return [self.lemmatizer.lemmatize(token) for token in tokens]
+            return [self._lemmatize_word(token) for token in tokens]
 
     def get_synonyms(self, word, max_synonyms=3):
         """
@@ -6,5 +6,6 @@ Handles scheduled crawling tasks and crawl history management.
 
 from .crawl_scheduler import CrawlScheduler
 from .crawl_history import CrawlHistory
+from .crawl_jobs import CrawlJobs
 
-__all__ = ['CrawlScheduler', 'CrawlHistory']
+__all__ = ['CrawlScheduler', 'CrawlHistory', 'CrawlJobs']
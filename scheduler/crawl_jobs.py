@@ -0,0 +1,187 @@
+"""
+Crawl Job Registry
+
+Tracks background crawl jobs in files under DATA_DIR so every process
+serving the app (e.g. gunicorn workers and the scheduler) sees the same
+jobs and at most one crawl runs at a time.
+"""
+
+import os
+import json
+import threading
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:
+    # No cross-process locking (Windows); crawls are then only
+    # serialized within one process, so run a single worker
+    fcntl = None
+
+import config
+
+
+def _lock(f, blocking=True):
+    """
+    Take an exclusive lock on an open file.
+
+    Returns:
+        True if the lock was acquired
+    """
+    if fcntl is None:
+        return True
+    flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+    try:
+        fcntl.flock(f.fileno(), flags)
+    except BlockingIOError:
+        return False
+    return True
+
+
+class CrawlJobs:
+    """Shared registry of crawl jobs and the lock held while one runs."""
+
+    def __init__(self, jobs_file=None, max_jobs=20, max_log_lines=20):
+        """
+        Initialize the crawl job registry.
+
+        Args:
+            jobs_file: JSON file holding the job records
+            max_jobs: Number of job records to keep
+            max_log_lines: Log lines kept per job
+        """
+        self.jobs_file = jobs_file or os.path.join(config.DATA_DIR, 'crawl_jobs.json')
+        self.run_lock_file = self.jobs_file + '.running'
+        self.max_jobs = max_jobs
+        self.max_log_lines = max_log_lines
+        # Serializes threads of this process; the file locks cover the rest
+        self._thread_lock = threading.Lock()
+        self._running = None  # (job_id, locked file) while this process crawls
+
+    def _update(self, fn):
+        """
+        Read, modify and rewrite the job records under the registry lock.
+
+        Args:
+            fn: Called with the records dict; modifies it in place
+        """
+        os.makedirs(os.path.dirname(self.jobs_file), exist_ok=True)
+        with open(self.jobs_file + '.lock', 'a') as lock_f:
+            _lock(lock_f)
+            jobs = self._load()
+            fn(jobs)
+            # Swap the file in so readers never see a partial write
+            tmp_path = self.jobs_file + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(jobs, f)
+            os.replace(tmp_path, self.jobs_file)
+
+    def _load(self):
+        """Load the job records, oldest first."""
+        try:
+            with open(self.jobs_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def try_start(self, trigger):
+        """
+        Register a new job if no crawl is running in any process.
+
+        The caller must run the crawl and then call finish().
+
+        Args:
+            trigger: What started the crawl ('scheduled' or 'manual')
+
+        Returns:
+            The new job id, or None if a crawl is already running
+        """
+        with self._thread_lock:
+            if self._running is not None:
+                return None
+            os.makedirs(os.path.dirname(self.run_lock_file), exist_ok=True)
+            run_f = open(self.run_lock_file, 'a')
+            if not _lock(run_f, blocking=False):
+                run_f.close()
+                return None
+
+            started_at = datetime.now()
+            job_id = started_at.strftime('%Y%m%d%H%M%S%f')
+            self._running = (job_id, run_f)
+
+        def add(jobs):
+            jobs[job_id] = {
+                'started_at': started_at.isoformat(),
+                'trigger': trigger,
+                'done': False,
+                'log': []
+            }
+            # Forget the oldest jobs
+            for old_id in list(jobs)[:-self.max_jobs]:
+                del jobs[old_id]
+
+        self._update(add)
+        return job_id
+
+    def append_log(self, msg):
+        """Add a log line to the job running in this process, if any."""
+        running = self._running
+        if running is None:
+            return
+        job_id = running[0]
+
+        def add_line(jobs):
+            job = jobs.get(job_id)
+            if job is not None:
+                job['log'] = (job['log'] + [msg])[-self.max_log_lines:]
+
+        self._update(add_line)
+
+    def finish(self, job_id, result):
+        """
+        Record a job's result and release the running lock.
+
+        Args:
+            job_id: Id returned by try_start()
+            result: Dictionary with the final 'status' and 'message'
+        """
+        def complete(jobs):
+            job = jobs.get(job_id)
+            if job is not None:
+                job['done'] = True
+                job['result'] = result
+
+        try:
+            self._update(complete)
+        finally:
+            with self._thread_lock:
+                if self._running is not None and self._running[0] == job_id:
+                    self._running[1].close()
+                    self._running = None
+
+    def is_running(self):
+        """Check whether any process is running a crawl."""
+        if self._running is not None:
+            return True
+        if not os.path.exists(self.run_lock_file):
+            return False
+        with open(self.run_lock_file, 'a') as run_f:
+            return not _lock(run_f, blocking=False)
+
+    def get(self, job_id):
+        """
+        Get a job record.
+
+        A job left unfinished by a process that died is reported as
+        failed once no process holds the running lock.
+
+        Returns:
+            The job record, or None if unknown
+        """
+        job = self._load().get(job_id)
+        if job is not None and not job['done'] and not self.is_running():
+            job = self._load().get(job_id)
+            if job is not None and not job['done']:
+                job['done'] = True
+                job['result'] = {'status': 'failed', 'message': 'Crawl was interrupted'}
+        return job
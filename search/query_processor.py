@@ -183,17 +183,6 @@ class QueryProcessor:
 
                 scored_docs.append((score, doc_id, doc))
 
-        # Sort based on sort_by parameter
-        if sort_by == 'year_desc':
-            # Sort by year descending, then by score
-            scored_docs.sort(key=lambda x: (self._get_year_for_sort(x[2]), x[0]), reverse=True)
-        elif sort_by == 'year_asc':
-            # Sort by year ascending (oldest first), then by score descending within same year
-            scored_docs.sort(key=lambda x: (self._get_year_for_sort(x[2]), -x[0]))
-        else:
-            # Default: sort by relevance score descending
-            scored_docs.sort(key=lambda x: x[0], reverse=True)
-        
         # Pagination
         total = len(scored_docs)
         total_pages = (total + per_page - 1) // per_page if total > 0 else 0
@@ -201,6 +190,18 @@ class QueryProcessor:
         
         start_idx = (page - 1) * per_page
         end_idx = start_idx + per_page
+
+        # Only the first end_idx entries are ever shown, so select them with a
+        # bounded heap (O(N log k)) instead of sorting every candidate
+        if sort_by == 'year_desc':
+            # Sort by year descending, then by score
+            scored_docs = heapq.nlargest(end_idx, scored_docs, key=lambda x: (self._get_year_for_sort(x[2]), x[0]))
+        elif sort_by == 'year_asc':
+            # Sort by year ascending (oldest first), then by score descending within same year
+            scored_docs = heapq.nsmallest(end_idx, scored_docs, key=lambda x: (self._get_year_for_sort(x[2]), -x[0]))
+        else:
+            # Default: sort by relevance score descending
+            scored_docs = heapq.nlargest(end_idx, scored_docs, key=lambda x: x[0])
         
         # Extract results for current page
         results = [(doc_id, doc, score) for score, doc_id, doc in scored_docs[start_idx:end_idx]]
@@ -1,4 +1,9 @@
-"""Script to train the document classifier with expanded dataset."""
+"""
+Script to train the document classifier with expanded dataset.
+
+Pass --incremental to stream the training file through partial_fit
+instead of loading it into memory (no holdout evaluation).
+"""
 import sys
 import os
 
@@ -20,18 +25,23 @@ def main():
     # Train the classifier
     print("\n2. Training classifier with expanded dataset...")
     trainer = ClassifierTrainer()
-    texts, labels = trainer.load_training_data()
-    print(f"   Loaded {len(texts)} training samples")
+    if '--incremental' in sys.argv[1:]:
+        print("\n3. Training model incrementally...")
+        stats = trainer.train_incremental(trainer.iter_training_data())
+        print(f"   Streamed {stats['total_samples']} training samples")
+    else:
+        texts, labels = trainer.load_training_data()
+        print(f"   Loaded {len(texts)} training samples")
 
-    # Count by category
-    counts = Counter(labels)
-    print("\n   Samples per category:")
-    for cat, count in sorted(counts.items()):
-        print(f"     - {cat}: {count}")
+        # Count by category
+        counts = Counter(labels)
+        print("\n   Samples per category:")
+        for cat, count in sorted(counts.items()):
+            print(f"     - {cat}: {count}")
 
-    # Train
-    print("\n3. Training model...")
-    stats = trainer.train(texts, labels)
+        # Train
+        print("\n3. Training model...")
+        stats = trainer.train(texts, labels)
 
     # Print report
     print("\n" + trainer.get_training_report())